@@ -1,13 +1,118 @@
 """Top-level shim to re-export `anchor.tools.code_tools` for test imports that expect `tools.code_tools`.
 """
 try:
-    from anchor.tools.code_tools import *  # noqa: F401, F403
+    from anchor.tools.code_tools import code_search, code_grep
 except Exception:
-    # Minimal fallback implementations
+    import functools
+    import mmap
+    import os
+    import re
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        import hyperscan
+    except Exception:
+        hyperscan = None
+
+    _SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+    def _iter_files(root: str):
+        """Yield regular file paths under root (os.scandir walk; cheaper than os.walk's per-dir listdir+stat)."""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path
+            except OSError:
+                continue
+
+    @functools.lru_cache(maxsize=128)
+    def _compile(query: str):
+        """Return scan(buf) -> [(start, end), ...] for query.
+
+        Uses a Hyperscan DFA (no backtracking, SIMD scan) when installed, else a compiled `re` pattern.
+        Whole files are scanned at once, so both run in multiline mode: ^ and $ match at each line.
+        Raises re.error if query is not a valid pattern.
+        """
+        if hyperscan is not None:
+            try:
+                db = hyperscan.Database()
+                db.compile(expressions=[query.encode()], flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_MULTILINE])
+                local = threading.local()  # Hyperscan scratch space must not be shared between threads
+
+                def scan(buf):
+                    scratch = getattr(local, "scratch", None)
+                    if scratch is None:
+                        scratch = local.scratch = hyperscan.Scratch(db)
+                    hits = []
+                    db.scan(buf, match_event_handler=lambda _id, start, end, _flags, _ctx: hits.append((start, end)), scratch=scratch)
+                    return hits
+                return scan
+            except hyperscan.error:
+                pass  # pattern not supported by Hyperscan (e.g. backreferences); use re
+        pattern = re.compile(query.encode(), re.MULTILINE)
+        return lambda buf: [m.span() for m in pattern.finditer(buf)]
+
+    def _scan_file(path: str, scan):
+        """Return [(line_no, line_text)] for lines of path that contain a match."""
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    if b"\0" in buf[:1024]:
+                        return []  # binary file
+                    hits = []
+                    # Walk matches in offset order so line numbers are counted incrementally, once per file
+                    line_no, counted_to, last_line_start = 1, 0, -1
+                    # A trailing newline leaves no line after it; skip empty matches there (e.g. "o*", "$")
+                    eof = len(buf) if buf[-1:] == b"\n" else -1
+                    for start, _end in sorted(scan(buf)):
+                        if start == eof:
+                            continue
+                        line_start = buf.rfind(b"\n", 0, start) + 1
+                        if line_start == last_line_start:
+                            continue  # one hit per line
+                        last_line_start = line_start
+                        line_no += buf[counted_to:line_start].count(b"\n")
+                        counted_to = line_start
+                        line_end = buf.find(b"\n", start)
+                        line_end = len(buf) if line_end == -1 else line_end
+                        hits.append((line_no, buf[line_start:line_end].decode("utf-8", "replace")))
+                    return hits
+        except (OSError, ValueError):
+            return []
+
     def code_search(root: str, query: str, **kwargs):
         return {"root": root, "query": query, "count": 0, "results": []}
 
     def code_grep(root: str, query: str, **kwargs):
-        return {"root": root, "query": query, "files": 0, "total_matches": 0, "results": []}
+        max_results = kwargs.get("max_results", 200)
+        try:
+            scan = _compile(query)
+        except re.error as e:
+            return {"root": root, "query": query, "files": 0, "total_matches": 0, "results": [], "error": f"invalid pattern: {e}"}
+        files = 0
+        total_matches = 0
+        results = []
+        paths = list(_iter_files(root))
+        # Per-file scans are dominated by open/read syscalls, so threads overlap them despite the GIL.
+        # map() keeps results in walk order.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            scanned = list(ex.map(lambda p: _scan_file(p, scan), paths))
+        for path, hits in zip(paths, scanned):
+            if not hits:
+                continue
+            files += 1
+            total_matches += len(hits)
+            for line_no, text in hits[:max(0, max_results - len(results))]:
+                results.append({"path": os.path.relpath(path, root), "line": line_no, "text": text})
+        return {"root": root, "query": query, "files": files, "total_matches": total_matches, "results": results}
 
 __all__ = ["code_search", "code_grep"]
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+import code_tools
+from code_tools import code_grep
+
+
+class TestCodeGrep(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, text):
+        with open(os.path.join(self.root, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_zero_width_match_at_eof_is_not_reported(self):
+        self._write("a.txt", "foo\nbar\n")
+
+        result = code_grep(self.root, "o*")
+        self.assertEqual([r["line"] for r in result["results"]], [1, 2])
+        self.assertEqual(result["total_matches"], 2)
+
+    def test_zero_width_match_on_last_line_without_newline(self):
+        self._write("a.txt", "foo\nbar")
+
+        result = code_grep(self.root, "$")
+        self.assertEqual([(r["line"], r["text"]) for r in result["results"]], [(1, "foo"), (2, "bar")])
+
+    def test_anchors_match_per_line(self):
+        self._write("a.py", "import os\ndef f():\n    pass\ndef g():\n")
+
+        result = code_grep(self.root, "^def")
+        self.assertEqual([(r["line"], r["text"]) for r in result["results"]], [(2, "def f():"), (4, "def g():")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,43 +1,56 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
+import orchestrator as _orchestrator
 from orchestrator import Orchestrator, MLCConnectionError
 
+
+def _resp(json=None, status=200):
+    """Plain stand-in for a requests.Response; far cheaper to build than a MagicMock."""
+    return SimpleNamespace(status_code=status, json=(lambda j=json: j), raise_for_status=(lambda: None))
+
 class TestOrchestrator(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Patch once and share one Orchestrator across the class; setUp resets per-test state.
+        cls._patches = ExitStack()
+        mocks = cls._patches.enter_context(patch.multiple(_orchestrator.requests, get=DEFAULT, post=DEFAULT))
+        cls.mock_get, cls.mock_post = mocks['get'], mocks['post']
+        cls.orc = Orchestrator()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._patches.close()
+
     def setUp(self):
-        self.orc = Orchestrator()
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+        self.mock_post.reset_mock(return_value=True, side_effect=True)
+        self.orc.active_model = None
 
-    @patch('requests.get')
-    def test_load_mlc_model_success(self, mock_get):
+    def test_load_mlc_model_success(self):
         # Mock successful bridge connection
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"data": [{"id": "webgpu-chat"}]}
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _resp(json={"data": [{"id": "webgpu-chat"}]})
 
         result = self.orc.load_mlc_model("my-model")
         self.assertTrue(result)
         self.assertEqual(self.orc.active_model, "my-model")
 
-    @patch('requests.get')
-    def test_load_mlc_model_failure(self, mock_get):
+    def test_load_mlc_model_failure(self):
         # Mock connection error
-        mock_get.side_effect = Exception("Connection refused")
+        self.mock_get.side_effect = Exception("Connection refused")
         
         with self.assertRaises(MLCConnectionError):
             self.orc.load_mlc_model("my-model")
 
-    @patch('requests.post')
-    def test_invoke_mlc_inference_success(self, mock_post):
+    def test_invoke_mlc_inference_success(self):
         self.orc.active_model = "test-model"
         
         # Mock successful inference
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        self.mock_post.return_value = _resp(json={
             "choices": [{"message": {"content": "Hello from MLC"}}]
-        }
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        })
 
         output = self.orc.invoke_mlc_inference("Hi")
         self.assertEqual(output, "Hello from MLC")
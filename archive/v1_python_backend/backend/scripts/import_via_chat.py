@@ -38,13 +38,23 @@ def count_tokens(text: str) -> int:
         return max(1, len(text) // 4)
 
 
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Per-text token counts from a single tiktoken encode_batch call."""
+    if tiktoken:
+        try:
+            enc = tiktoken.get_encoding("cl100k_base")
+            return [len(ids) for ids in enc.encode_batch(texts, disallowed_special=())]
+        except Exception:
+            pass
+    return [max(1, len(t) // 4) if t else 0 for t in texts]
+
+
 def chunk_text_by_tokens(text: str, max_tokens: int) -> List[str]:
     lines = [l.strip() for l in text.splitlines() if l.strip()]
     chunks = []
     current = []
     current_tokens = 0
-    for line in lines:
-        tokens = count_tokens(line)
+    for line, tokens in zip(lines, count_tokens_batch(lines)):
         # if single line exceeds max_tokens, split roughly by characters
         if tokens > max_tokens and current_tokens == 0:
             # rough fallback split
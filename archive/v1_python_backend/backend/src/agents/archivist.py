@@ -286,6 +286,8 @@ class ArchivistAgent:
                             deleted += 1
                         except Exception as e:
                             logger.error(f"Archivist-Janitor: Failed to delete node {row.get('id')}: {e}")
+                if deleted:
+                    await self._invalidate_search_cache()
                 # if dry_run, list candidates to log
                 if dry_run:
                     for row in rows:
@@ -295,6 +297,12 @@ class ArchivistAgent:
         logger.info(f"Archivist-Janitor: Purge results: found={found} deleted={deleted} dry_run={dry_run}")
         return {"found": found, "deleted": deleted}
 
+    async def _invalidate_search_cache(self):
+        """Direct Cypher deletes bypass TieredMemory, so drop cached searches that may list the deleted nodes."""
+        redis_cache = getattr(self.memory, 'redis', None)
+        if redis_cache:
+            await redis_cache.invalidate_search_results()
+
     async def prune_stale(self):
         """
         Prune nodes with low importance (<3) and old age (>90 days).
@@ -309,6 +317,7 @@ class ArchivistAgent:
         
         try:
             await self.memory.neo4j.execute_cypher(query, {"threshold": threshold})
+            await self._invalidate_search_cache()
             logger.info("Archivist: Pruned stale nodes.")
         except Exception as e:
             logger.error(f"Pruning failed: {e}")
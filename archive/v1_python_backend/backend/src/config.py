@@ -145,6 +145,9 @@ class Settings(BaseSettings):
     # Memory thresholds
     max_context_tokens: int = 60000  # Max tokens in total context (synchronized with 64k hardware window, leaving 5k buffer for output)
     summarize_threshold: int = 48000  # Trigger summarization when Redis exceeds this (allowing much longer conversations before forcing rotation)
+    # Active-context rotation: "summarize" (LLM summary past summarize_threshold) or
+    # "mem_aware" (fold older turns' <mem> blocks into a checkpoint past 80% of it; no LLM call)
+    context_rotation_strategy: str = "summarize"
     
     # ============================================================
     # CONTEXT_MANAGER.PY - Context Assembly
@@ -159,6 +162,11 @@ class Settings(BaseSettings):
     context_recent_turns: int = 50  # Recent conversation turns to include (increased from 10 to support 50+ exchanges)
     context_summary_limit: int = 20  # Max historical summaries to include (increased from 8)
     context_entity_limit: int = 50  # Max entity-based memories (increased from 15)
+    # Per-section token budgets for build_context, as fractions of (llm_context_size - llm_max_tokens).
+    # The remainder is headroom for the system prompt, tool schemas and the user's message.
+    context_history_frac: float = 0.50
+    context_summary_frac: float = 0.10
+    context_memory_frac: float = 0.20
 
     # Defaults for memory provenance & freshness
     memory_default_provenance_score: float = 0.5  # Default provenance when metadata is unknown (0.0-1.0)
@@ -166,6 +174,9 @@ class Settings(BaseSettings):
     # Distiller caching settings
     memory_distill_cache_enabled: bool = True
     memory_distill_cache_ttl: int = 86400  # in seconds
+    # Redis hot cache for search_memories results (invalidated on every memory write)
+    memory_search_cache_enabled: bool = True
+    memory_search_cache_ttl: int = 300  # in seconds
 
     # ============================================================
     # ARCHIVIST - Auto-Purge (Janitor) Settings
@@ -1,5 +1,6 @@
 """Context Manager: Assembles context and manages overflow."""
 import logging
+import re
 from typing import Optional
 from datetime import datetime, timezone
 from src.memory import TieredMemory
@@ -10,6 +11,12 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# mem_aware rotation: <mem>/<memory> blocks carried into the checkpoint, and the boundary before each turn
+_MEM_BLOCK_RE = re.compile(r'<mem(?:ory)?\b[^>]*>(.*?)</mem(?:ory)?>', re.S)
+_TURN_SPLIT_RE = re.compile(r'\n(?=User: )')
+# An XML entity cut in half by truncation (complete ones end in ';')
+_PARTIAL_ENTITY_RE = re.compile(r'&[#0-9A-Za-z]*$')
+
 class ContextManager:
     def __init__(self, memory: TieredMemory, llm: LLMClient):
         self.memory = memory
@@ -31,9 +38,8 @@ class ContextManager:
             # Assuming memory.search_by_tags exists or we use vector search with the tag as query
             
             primed = []
-            for tag in tags:
-                # Use the tag as a query for vector search (heuristic)
-                results = await self.memory.search_memories(tag, limit=3)
+            # Use each tag as a query (heuristic); searches run concurrently
+            for results in await self.memory.search_memories_batch(tags, limit=3):
                 if results:
                     primed.extend(results)
             
@@ -101,6 +107,7 @@ class ContextManager:
         
         # 5. Build final context from filtered results
         parts = []
+        budgets = self._section_budgets()
 
         # A. Current datetime
         current_dt = datetime.now(timezone.utc)
@@ -119,6 +126,7 @@ class ContextManager:
         # Keeping this early provides continuity
         if filtered["active_context"]:
             recent_turns = "\n".join(filtered["active_context"].split("\n")[-100:])  # Preserve more turns (from 40 to 100)
+            recent_turns = self._truncate_to_tokens(recent_turns, budgets["history"], keep_tail=True)
             logger.debug(f"Adding current conversation ({len(recent_turns)} chars)")
             parts.append(f"# Current Conversation (This Session):\n{recent_turns}")
 
@@ -132,12 +140,13 @@ class ContextManager:
                     hist_parts.append(mp)
                 except Exception:
                     continue
+            hist_parts = self._fit_items(hist_parts, budgets["summaries"])
             parts.append('<historical_summaries>\n' + '\n'.join(hist_parts) + '\n</historical_summaries>')
 
         # D. Relevant Memories / RAG (Moved UP)
         # This acts as the "background knowledge" section
         if filtered.get("relevant_memories"):
-            mem_parts = []
+            mem_entries = []
             for mem in filtered['relevant_memories']:
                 try:
                     mid = mem.get('id') or mem.get('memory_id') or ''
@@ -154,11 +163,17 @@ class ContextManager:
                     content = mem.get('content') or ''
 
                     import xml.sax.saxutils as saxutils
-                    esc_content = saxutils.escape(str(content))
-                    mp = f'<memory id="{mid}" source="{saxutils.escape(str(src))}" status="{saxutils.escape(str(status))}" date="{saxutils.escape(str(date))}">{esc_content}</memory>'
-                    mem_parts.append(mp)
+                    open_tag = f'<memory id="{mid}" source="{saxutils.escape(str(src))}" status="{saxutils.escape(str(status))}" date="{saxutils.escape(str(date))}">'
+                    mem_entries.append((open_tag, str(content)))
                 except Exception:
                     continue
+            # Share the budget across all memories (each keeps its head) instead of dropping whole entries.
+            # Content is escaped before it is truncated, so the budget covers the text actually sent,
+            # and the tags are charged what they tokenize to.
+            wrapper = "<retrieved_memory>\n" + "\n".join(f'{open_tag}</memory>' for open_tag, _ in mem_entries) + "\n</retrieved_memory>"
+            tag_overhead = self.memory.count_tokens(wrapper)
+            contents = self._truncate_segments([saxutils.escape(c) for _, c in mem_entries], max(0, budgets["memories"] - tag_overhead))
+            mem_parts = [f'{open_tag}{_PARTIAL_ENTITY_RE.sub("", c)}</memory>' for (open_tag, _), c in zip(mem_entries, contents)]
             parts.append("<retrieved_memory>\n" + "\n".join(mem_parts) + "\n</retrieved_memory>")
 
         # NEW: Context Rotation Protocol to maintain optimal window size for 64k limits
@@ -440,6 +455,12 @@ class ContextManager:
 
         token_count = self.memory.count_tokens(updated_context)
 
+        if settings.context_rotation_strategy == "mem_aware" and token_count > 0.8 * settings.summarize_threshold:
+            checkpointed = await self._mem_aware_rotate(session_id, updated_context, token_count)
+            if checkpointed is not None:
+                await self.memory.save_active_context(session_id, checkpointed)
+                return
+
         if token_count > settings.summarize_threshold:
             summary = await self._summarize_context(updated_context)
             await self.memory.flush_to_neo4j(session_id, summary, original_tokens=token_count)
@@ -448,6 +469,107 @@ class ContextManager:
         else:
             await self.memory.save_active_context(session_id, updated_context)
     
+    def _truncate_to_tokens(self, text: str, max_tokens: int, keep_tail: bool = False) -> str:
+        """Trim text to at most max_tokens, keeping the head (or tail) and snapping to a sentence boundary.
+
+        Binary-searches the cut offset, so the tokenizer runs O(log n) times instead of once per trimmed chunk.
+        """
+        # A BPE token covers at least one byte, so short texts fit without touching the tokenizer
+        if len(text.encode("utf-8")) <= max_tokens or self.memory.count_tokens(text) <= max_tokens:
+            return text
+        if keep_tail:
+            lo, hi = 0, len(text)  # text[hi:] always fits; find the smallest start offset that does
+            while lo < hi - 1:
+                mid = (lo + hi) // 2
+                if self.memory.count_tokens(text[mid:]) <= max_tokens:
+                    hi = mid
+                else:
+                    lo = mid
+            window = text[hi:hi + 200]
+            ends = [window.find(p) for p in ('. ', '! ', '? ', '\n')]
+            ends = [e for e in ends if e >= 0]
+            cut = hi + min(ends) + 1 if ends else hi
+            return text[cut:].lstrip()
+        lo, hi = 0, len(text)  # text[:lo] always fits; find the largest end offset that does
+        while lo < hi - 1:
+            mid = (lo + hi) // 2
+            if self.memory.count_tokens(text[:mid]) <= max_tokens:
+                lo = mid
+            else:
+                hi = mid
+        window_start = max(0, lo - 200)
+        cut = max(text.rfind(p, window_start, lo) for p in ('.', '!', '?', '\n'))
+        return text[:cut + 1] if cut >= 0 else text[:lo]
+
+    def _fit_items(self, items: list, max_tokens: int) -> list:
+        """Return the longest prefix of items whose newline-joined text fits in max_tokens (binary search)."""
+        joined = "\n".join(items)
+        if len(joined.encode("utf-8")) <= max_tokens or self.memory.count_tokens(joined) <= max_tokens:
+            return items
+        lo, hi = 0, len(items)  # items[:lo] always fits
+        while lo < hi - 1:
+            mid = (lo + hi) // 2
+            if self.memory.count_tokens("\n".join(items[:mid])) <= max_tokens:
+                lo = mid
+            else:
+                hi = mid
+        return items[:lo]
+
+    def _truncate_segments(self, segments: list, total_budget: int, header_tokens: int = 128) -> list:
+        """Fit segments into total_budget tokens while keeping every segment represented.
+
+        Each segment is guaranteed its first header_tokens (shrunk if the budget cannot cover n headers);
+        the rest of the budget is water-filled, smallest segments first, so short segments keep everything
+        and the slack they leave goes to longer ones. Each segment is truncated from its tail.
+        """
+        if not segments:
+            return []
+        n = len(segments)
+        header_tokens = min(header_tokens, total_budget // n)
+        sizes = [self.memory.count_tokens(seg) for seg in segments]
+        limits = [0] * n
+        remaining = max(0, total_budget)
+        for left, i in enumerate(sorted(range(n), key=sizes.__getitem__)):
+            share = remaining // (n - left)
+            limits[i] = min(sizes[i], max(header_tokens, share))
+            remaining -= limits[i]
+        return [seg if limits[i] >= sizes[i] else self._truncate_to_tokens(seg, limits[i]) for i, seg in enumerate(segments)]
+
+    def _section_budgets(self) -> dict:
+        """Split the prompt budget (context window minus the response reserve) into per-section token budgets."""
+        available = max(0, settings.llm_context_size - settings.llm_max_tokens)
+        return {
+            "history": int(available * settings.context_history_frac),
+            "summaries": int(available * settings.context_summary_frac),
+            "memories": int(available * settings.context_memory_frac),
+        }
+
+    async def _mem_aware_rotate(self, session_id: str, context: str, token_count: int) -> Optional[str]:
+        """
+        Checkpoint rotation without an LLM call.
+
+        Keeps the two most recent turns verbatim and replaces everything older with a single
+        [CHECKPOINT] block made of the <mem>...</mem> (or <memory>) spans found in those turns,
+        tags included, so a previous checkpoint is carried forward intact. The new spans are
+        flushed to Neo4j. Returns None (caller falls back to summarization) when the older turns
+        hold no spans or the rotated context would still exceed summarize_threshold.
+        """
+        turns = [t for t in _TURN_SPLIT_RE.split(context) if t.strip()]
+        previous = turns.pop(0) if turns and turns[0].startswith("[CHECKPOINT]") else ""
+        if len(turns) <= 2:
+            return None
+        older, recent = turns[:-2], turns[-2:]
+        new_blocks = [m.group(0).strip() for turn in older for m in _MEM_BLOCK_RE.finditer(turn) if m.group(1).strip()]
+        if not new_blocks:
+            return None
+        carried = [m.group(0).strip() for m in _MEM_BLOCK_RE.finditer(previous)]
+        checkpoint = "[CHECKPOINT]\n" + "\n".join(carried + new_blocks)
+        rotated = "\n".join([checkpoint] + recent)
+        if self.memory.count_tokens(rotated) > settings.summarize_threshold:
+            return None
+        await self.memory.flush_to_neo4j(session_id, "[CHECKPOINT]\n" + "\n".join(new_blocks), original_tokens=token_count)
+        return rotated
+
     async def _summarize_context(self, context: str) -> str:
         """
         CHUNKED Markovian summarization with Distiller annotation.
@@ -536,9 +658,10 @@ Each annotation represents a chunk of a larger conversation. Synthesize them int
 Preserve granularity and specificity across all chunks."""
 
         # If annotations are still too large, truncate to most recent
-        max_chars = 6000 * 4  # Increased from 4000 to ~6000 tokens
-        if len(combined_annotations) > max_chars:
-            combined_annotations = "...[earlier annotations truncated]...\n\n" + combined_annotations[-max_chars:]
+        max_tokens = 6000  # Increased from 4000
+        truncated = self._truncate_to_tokens(combined_annotations, max_tokens, keep_tail=True)
+        if truncated != combined_annotations:
+            combined_annotations = "...[earlier annotations truncated]...\n\n" + truncated
         
         final = await self.llm.generate(
             prompt=f"Synthesize these chunk annotations:\n\n{combined_annotations}",
@@ -35,6 +35,26 @@ _distill_cache_limit = 4096
 _llm_semaphore: Optional[asyncio.Semaphore] = None
 
 
+def _cache_key(text: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    """Content-addressed cache key: BLAKE2b-128 over text + canonical metadata (stable across processes for Redis reuse)."""
+    return _hashlib.blake2b((text + _json.dumps(metadata or {}, sort_keys=True)).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Any:
+    value = _distill_cache.get(key)
+    if value is not None:
+        _distill_cache.move_to_end(key)
+    return value
+
+
+def _cache_put(key: str, value: Any) -> None:
+    _distill_cache[key] = value
+    _distill_cache.move_to_end(key)
+    if len(_distill_cache) > _distill_cache_limit:
+        # evict the least recently used entry
+        _distill_cache.popitem(last=False)
+
+
 class DistilledEntity(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     text: str
@@ -73,6 +93,14 @@ def _normalize_entity_dict(e: Dict[str, Any]) -> Dict[str, Any]:
     return e
 
 
+# Heuristic extractor / sentence-splitter patterns, compiled once at import
+_VERSION_RE = re.compile(r'v\d+\.\d+(?:\.\d+)?')
+_PATH_RE = re.compile(r'\b(?:[A-Za-z0-9\-_/\\]+\/[A-Za-z0-9\-_.]+)\b')
+_PKG_RE = re.compile(r'\b(?:npm|pip|apt-get|docker|cargo)\b', re.IGNORECASE)
+_PROPER_NOUN_RE = re.compile(r"\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
 def _simple_entity_extraction(text: str, max_entities: int = 10) -> List[DistilledEntity]:
     # Add technical entity extraction if a technical signal exists
     from src.content_utils import has_technical_signal
@@ -80,36 +108,30 @@ def _simple_entity_extraction(text: str, max_entities: int = 10) -> List[Distill
     seen = set()
     if has_technical_signal(text):
         # extract version numbers, file paths, package names, and error codes
-        version_re = re.compile(r'v\d+\.\d+(?:\.\d+)?')
-        path_re = re.compile(r'\b(?:[A-Za-z0-9\-_/\\]+\/[A-Za-z0-9\-_.]+)\b')
-        pkg_re = re.compile(r'\b(?:npm|pip|apt-get|docker|cargo)\b', re.IGNORECASE)
-        for m in version_re.findall(text):
+        for m in _VERSION_RE.findall(text):
             key = m.lower()
             if key not in seen:
                 seen.add(key)
                 entities.append(DistilledEntity(text=m, type='version'))
-        for m in path_re.findall(text):
+        for m in _PATH_RE.findall(text):
             key = m.lower()
             if key not in seen:
                 seen.add(key)
                 entities.append(DistilledEntity(text=m, type='path'))
-        for m in pkg_re.findall(text):
+        for m in _PKG_RE.findall(text):
             key = m.lower()
             if key not in seen:
                 seen.add(key)
                 entities.append(DistilledEntity(text=m, type='package'))
         # also fallback to proper nouns
-        pattern = r"\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b"
-        matches = re.findall(pattern, text)
-        for m in matches:
+        for m in _PROPER_NOUN_RE.findall(text):
             k = m.strip().lower()
             if k in seen:
                 continue
             seen.add(k)
             entities.append(DistilledEntity(text=m, type='proper_noun'))
         return entities[:max_entities]
-    pattern = r"\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b"
-    matches = re.findall(pattern, text)
+    matches = _PROPER_NOUN_RE.findall(text)
     out: List[DistilledEntity] = []
     for m in matches:
         key = m.strip().lower()
@@ -202,8 +224,8 @@ class Distiller:
         # Check cache before calling LLM (avoid repeated distillations during ingestion)
         try:
             # Include metadata in the hash so that different metadata results can be cached separately
-            content_hash = _hashlib.sha256((text + _json.dumps(metadata or {}, sort_keys=True)).encode('utf-8')).hexdigest()
-            cached = _distill_cache.get(content_hash)
+            content_hash = _cache_key(text, metadata)
+            cached = _cache_get(content_hash)
             if cached:
                 return cached
         except Exception:
@@ -256,10 +278,7 @@ class Distiller:
         moment = DistilledMoment(text=text, summary=summary, entities=entities, score=score)
         # Write to in-memory cache with limited size
         try:
-            _distill_cache[content_hash] = moment.dict()
-            if len(_distill_cache) > _distill_cache_limit:
-                # pop the oldest
-                _distill_cache.popitem(last=False)
+            _cache_put(content_hash, moment.dict())
         except Exception:
             pass
         return moment.dict()
@@ -316,17 +335,22 @@ class Distiller:
                     end = start + last_newline
                     seg = text[start:end]
             chunks.append(seg)
-            # Advance, with overlap
-            start = max(0, end - overlap_chars)
+            if end >= text_len:
+                break
+            # Advance, with overlap (always make forward progress)
+            start = max(start + 1, end - overlap_chars)
         logger.info(f"Chunked text into {len(chunks)} parts for distillation")
         # Distill each chunk
         chunk_summaries = []
         chunk_entities = []
-        for i, c in enumerate(chunks):
-            try:
-                res = await self._call_llm(c, skip_chunking=True, max_entities=max_entities)
-            except Exception as e:
-                logger.warning(f"Failed to distill chunk {i} independently: {e}")
+        # Chunks are independent: distill them concurrently (generate calls are bounded by _llm_semaphore)
+        results = await asyncio.gather(
+            *(self._call_llm(c, skip_chunking=True, max_entities=max_entities) for c in chunks),
+            return_exceptions=True,
+        )
+        for i, res in enumerate(results):
+            if isinstance(res, Exception):
+                logger.warning(f"Failed to distill chunk {i} independently: {res}")
                 continue
             parsed = None
             if isinstance(res, dict):
@@ -422,12 +446,12 @@ class Distiller:
         if summaries:
             texts = [s.get("summary") or s.get("text") for s in summaries]
             joined = " ".join([t for t in texts if t])
-            sentences = re.split(r"(?<=[.!?])\s+", joined)
+            sentences = _SENT_SPLIT.split(joined)
             return " ".join([s.strip() for s in sentences if s.strip()][:max_sentences])
         if memories:
             texts = [m.get("content") for m in memories if m.get("content")]
             joined = " ".join(texts)
-            sentences = re.split(r"(?<=[.!?])\s+", joined)
+            sentences = _SENT_SPLIT.split(joined)
             return " ".join([s.strip() for s in sentences if s.strip()][:max_sentences])
         return ""
 
@@ -453,7 +477,7 @@ def filter_and_consolidate(entities: Iterable[DistilledEntity]) -> List[Distille
 def make_compact_summary(moment: DistilledMoment, max_sentences: int = 3) -> str:
     if moment.summary and moment.summary.strip():
         return moment.summary.strip()
-    sentences = re.split(r"(?<=[.!?])\s+", moment.text)
+    sentences = _SENT_SPLIT.split(moment.text)
     return " ".join([s.strip() for s in sentences if s.strip()][:max_sentences])
 
 
@@ -478,7 +502,7 @@ async def distill_moment(text: str, llm_client: Optional[Any] = None, metadata:
                     except Exception:
                         _redis_client = None
             if _redis_client is not None:
-                key = _hashlib.sha256((text + _json.dumps(metadata or {}, sort_keys=True)).encode('utf-8')).hexdigest()
+                key = _cache_key(text, metadata)
                 try:
                     val = await _redis_client.get(key)
                     if val:
@@ -492,10 +516,8 @@ async def distill_moment(text: str, llm_client: Optional[Any] = None, metadata:
     result = await d.distill_moment(text, metadata=metadata, **kwargs)
     # Cache to Redis + in-memory cache if enabled
     try:
-        content_hash = _hashlib.sha256((text + _json.dumps(metadata or {}, sort_keys=True)).encode('utf-8')).hexdigest()
-        _distill_cache[content_hash] = result
-        if len(_distill_cache) > _distill_cache_limit:
-            _distill_cache.popitem(last=False)
+        content_hash = _cache_key(text, metadata)
+        _cache_put(content_hash, result)
         if getattr(settings, 'memory_distill_cache_enabled', False) and getattr(settings, 'redis_url', None) and _redis_client:
             try:
                 await _redis_client.set(content_hash, _json.dumps(result), ex=getattr(settings, 'memory_distill_cache_ttl', 86400))
@@ -20,6 +20,10 @@ from src.chat_templates import chat_template_manager
 
 logger = logging.getLogger(__name__)
 
+# Local GGUF models are shared across LLMClient instances: loading one costs seconds and GBs of (V)RAM,
+# and bootstrap, planner and TieredMemory each build their own client. Keyed by the load parameters.
+_local_llm_pool: Dict[tuple, object] = {}
+
 
 class EmbeddingsAPIError(RuntimeError):
     """Raised when embedding API responds with an error. Contains parsed info if available.
@@ -227,19 +231,24 @@ class LLMClient:
                 print(f"⚠️  Model not found: {self.model_path}")
                 return
             
-            print(f"🔧 Loading local GGUF model: {self.model_path}")
             # Use setting to control whether the local model exposes embedding() API
             enable_embedding = getattr(settings, 'llm_local_embeddings', True)
-            self._local_llm = Llama(
-                model_path=self.model_path,
-                n_ctx=settings.llm_context_size,
-                n_gpu_layers=settings.llm_gpu_layers,
-                n_threads=settings.llm_threads,
-                verbose=False
-                , embedding=enable_embedding
-            )
+            pool_key = (self.model_path, settings.llm_context_size, settings.llm_gpu_layers, settings.llm_threads, enable_embedding)
+            shared = _local_llm_pool.get(pool_key)
+            if shared is None:
+                print(f"🔧 Loading local GGUF model: {self.model_path}")
+                shared = Llama(
+                    model_path=self.model_path,
+                    n_ctx=settings.llm_context_size,
+                    n_gpu_layers=settings.llm_gpu_layers,
+                    n_threads=settings.llm_threads,
+                    verbose=False
+                    , embedding=enable_embedding
+                )
+                _local_llm_pool[pool_key] = shared
+                print(f"✅ Local model loaded")
+            self._local_llm = shared
             self._local_llm_embedding_enabled = enable_embedding
-            print(f"✅ Local model loaded")
         except ImportError:
             print("⚠️  llama-cpp-python not installed. Install with: pip install llama-cpp-python")
         except Exception as e:
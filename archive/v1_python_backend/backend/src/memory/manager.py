@@ -1,6 +1,8 @@
+import asyncio
 import logging
+import functools
 import tiktoken
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from src.config import settings
 from src.content_utils import clean_content, is_json_like, is_html_like, has_technical_signal
 import hashlib
@@ -11,6 +13,40 @@ from src.distiller import distill_moment
 
 logger = logging.getLogger(__name__)
 
+# Shared encoder: tiktoken encodings are immutable, so every TieredMemory can use one. Loaded on
+# first use, since get_encoding may need the network (or a warm cache) and must not run at import.
+_TOKENIZER = None
+
+
+def _get_tokenizer():
+    global _TOKENIZER
+    if _TOKENIZER is None:
+        _TOKENIZER = tiktoken.get_encoding("cl100k_base")
+    return _TOKENIZER
+
+
+# Only strings up to this length are memoized; long contexts are rarely repeated verbatim
+# and caching them would pin large strings in memory.
+_COUNT_MEMO_MAX_CHARS = 512
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_short_str(text: str) -> int:
+    """Memoized token count for the shared encoder (repeat strings become a dict lookup)."""
+    return len(_get_tokenizer().encode(text, disallowed_special=()))
+
+
+def _count_str(text: str) -> int:
+    if len(text) <= _COUNT_MEMO_MAX_CHARS:
+        return _count_short_str(text)
+    return len(_get_tokenizer().encode(text, disallowed_special=()))
+
+
+# Max concurrent Neo4j searches issued by search_memories_batch
+_SEARCH_CONCURRENCY = 5
+_search_semaphore: Optional[asyncio.Semaphore] = None
+
+
 class TieredMemory:
     """
     Orchestrator for Tiered Memory (Redis + Neo4j).
@@ -21,7 +57,7 @@ class TieredMemory:
         self.redis = RedisCache(redis_url)
         self.neo4j = Neo4jStore(neo4j_uri, neo4j_user, neo4j_password)
         self.llm_client = llm_client
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self._tokenizer = None  # None: the shared encoder
         
         # Vector support
         self.vector_adapter = None
@@ -34,6 +70,14 @@ class TieredMemory:
 
         # Backwards-compatible property accessors for legacy tests & code
 
+    @property
+    def tokenizer(self):
+        return self._tokenizer if self._tokenizer is not None else _get_tokenizer()
+
+    @tokenizer.setter
+    def tokenizer(self, value):
+        self._tokenizer = value
+
     async def initialize(self):
         """Initialize all stores."""
         await self.redis.initialize()
@@ -158,12 +202,18 @@ class TieredMemory:
 
         # Compute a content hash for dedup (based on cleaned content to avoid duplicate noisy entries)
         content_hash = hashlib.sha256((content_cleaned or '').encode('utf-8')).hexdigest()
+        # Use provided llm_client or self.llm_client
+        client = llm_client or self.llm_client
+        if client and content_cleaned:
+            # Repeat content: return the stored memory before paying for an LLM distill call.
+            # Without a client, neo4j.add_memory's own content_hash check is enough.
+            existing_id = await self.neo4j.find_memory_by_content_hash(content_hash)
+            if existing_id:
+                return existing_id
 
         # 1. Distill entities (Graph Wiring)
         entities = []
         try:
-            # Use provided llm_client or self.llm_client
-            client = llm_client or self.llm_client
             if client and content_cleaned:
                 distilled = await distill_moment(content_cleaned, llm_client=client, metadata=metadata)
                 if isinstance(distilled, dict):
@@ -180,6 +230,9 @@ class TieredMemory:
                 tags.append('#technical')
 
         memory_id = await self.neo4j.add_memory(session_id, content, category, tags, importance, metadata, entities=entities, content_cleaned=content_cleaned, content_hash=content_hash, content_embedding_text=content_cleaned if not tech_signal else content_cleaned)
+        if memory_id:
+            if self.redis:
+                await self.redis.invalidate_search_results()
         
         # 3. Vector Indexing (Semantic Search)
         if self.vector_adapter and self._vector_enabled and memory_id and content_cleaned:
@@ -211,12 +264,32 @@ class TieredMemory:
         # Return the created memory id
         return memory_id
     async def search_memories(self, query_text: Optional[str] = None, category: Optional[str] = None, tags: Optional[List[str]] = None, limit: int = 10) -> List[Dict[str, Any]]:
-        if not query_text:
-            # Fallback to recent if no query
-            # Note: Neo4jStore needs a get_recent method, adding it to TODO or using direct cypher
-            # For now, simple search
-            return await self.neo4j.search_memories("", category, limit)
-        return await self.neo4j.search_memories(query_text, category, limit)
+        # Fallback to recent if no query
+        # Note: Neo4jStore needs a get_recent method, adding it to TODO or using direct cypher
+        # For now, simple search
+        query_text = query_text or ""
+        use_cache = bool(getattr(settings, "memory_search_cache_enabled", False) and self.redis)
+        if use_cache:
+            query_key = hashlib.sha1(f"{query_text}|{category}|{limit}".encode("utf-8")).hexdigest()
+            version, cached = await self.redis.get_search_results(query_key)
+            if cached is not None:
+                return cached
+        results = await self.neo4j.search_memories(query_text, category, limit)
+        if use_cache and results:
+            await self.redis.save_search_results(query_key, results, ttl=getattr(settings, "memory_search_cache_ttl", 300), version=version)
+        return results
+
+    async def search_memories_batch(self, queries: List[str], category: Optional[str] = None, limit: int = 10) -> List[List[Dict[str, Any]]]:
+        """Run several searches concurrently (bounded); results are returned in query order."""
+        global _search_semaphore
+        if _search_semaphore is None:
+            _search_semaphore = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+        async def _controlled_search(query: str) -> List[Dict[str, Any]]:
+            async with _search_semaphore:
+                return await self.search_memories(query_text=query, category=category, limit=limit)
+
+        return list(await asyncio.gather(*(_controlled_search(q) for q in queries)))
 
     async def search_memories_neo4j(self, query_text: str, category: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Search memories specifically in Neo4j (full-text)."""
@@ -241,6 +314,8 @@ class TieredMemory:
             importance=3,
             metadata={}
         )
+        if self.redis:
+            await self.redis.invalidate_search_results()
 
     async def flush_to_neo4j(self, session_id: str, summary: str, original_tokens: int):
         """Flush summary to Neo4j."""
@@ -252,8 +327,16 @@ class TieredMemory:
             importance=3,
             metadata={"original_token_count": original_tokens}
         )
+        if self.redis:
+            await self.redis.invalidate_search_results()
 
-    def count_tokens(self, text: str) -> int:
+    def count_tokens(self, text: Union[str, List[str]]) -> int:
         if not text: return 0
-        try: return len(self.tokenizer.encode(text, disallowed_special=()))
+        if not isinstance(text, str):
+            text = "".join(text)
+        try:
+            # Only the shared encoder is memoized; a swapped-in tokenizer is always called directly.
+            if self._tokenizer is None:
+                return _count_str(text)
+            return len(self.tokenizer.encode(text, disallowed_special=()))
         except: return len(text) // 4
@@ -116,6 +116,11 @@ class Neo4jStore:
             logger.error(f"Cypher execution failed: {e}")
             return []
 
+    async def find_memory_by_content_hash(self, content_hash: str) -> Optional[str]:
+        """Return the id of a stored memory with this content_hash, or None."""
+        rows = await self.execute_cypher("MATCH (m:Memory) WHERE m.content_hash = $content_hash RETURN elementId(m) as id LIMIT 1", {"content_hash": content_hash})
+        return rows[0].get("id") if rows else None
+
     async def add_memory(self, session_id: str, content: str, category: str, tags: List[str], importance: int, metadata: Dict[str, Any], entities: List[Dict[str, Any]] = None, content_cleaned: str = None, content_hash: str = None, content_embedding_text: str = None, created_at: str = None):
         """Add memory node and link entities."""
         if not self.neo4j_driver:
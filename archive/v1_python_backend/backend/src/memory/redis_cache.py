@@ -1,11 +1,34 @@
 import redis.asyncio as redis
+import json
 import logging
 import time
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from src.config import settings
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Bumped on every memory write; embedding it in search keys invalidates all cached results at once
+SEARCH_VERSION_KEY = "mem:search:version"
+
+
+# Failures the search cache tolerates (Redis down/timeouts, undecodable payloads); anything else is a bug and propagates
+_SEARCH_CACHE_ERRORS = (redis.RedisError, ValueError)
+
+
+def _dumps(value: Any):
+    """Serialize a cache payload; orjson (bytes, several times faster) when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str)
+
+
+def _loads(payload):
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
 class RedisCache:
     """Handles Redis interactions for TieredMemory."""
     
@@ -78,3 +101,40 @@ class RedisCache:
             logger.info(f"Cleared Redis cache for session: {session_id}")
         except Exception as e:
             logger.error(f"Failed to clear session {session_id}: {e}")
+
+    async def get_search_results(self, query_key: str) -> Tuple[Optional[Any], Optional[List[Dict[str, Any]]]]:
+        """Return (version, cached results or None on miss) for query_key.
+
+        Pass the version to save_search_results so results computed after this read are cached
+        under the version they were computed against; a write in between bumps the version and
+        leaves them unreachable. The version is None when Redis could not be read.
+        """
+        if not self.redis:
+            return None, None
+        try:
+            version = await self.redis.get(SEARCH_VERSION_KEY) or 0
+            if isinstance(version, bytes):
+                version = version.decode()
+            payload = await self.redis.get(f"mem:search:v{version}:{query_key}")
+            return version, (_loads(payload) if payload else None)
+        except _SEARCH_CACHE_ERRORS as e:
+            logger.debug(f"Search cache read failed: {e}")
+            return None, None
+
+    async def save_search_results(self, query_key: str, results: List[Dict[str, Any]], ttl: int, version: Any):
+        """Cache search results under the search version returned by get_search_results."""
+        if not self.redis or version is None:
+            return
+        try:
+            await self.redis.set(f"mem:search:v{version}:{query_key}", _dumps(results), ex=ttl)
+        except _SEARCH_CACHE_ERRORS as e:
+            logger.debug(f"Search cache write failed: {e}")
+
+    async def invalidate_search_results(self):
+        """Invalidate every cached search by bumping the version counter (old keys expire via TTL)."""
+        if not self.redis:
+            return
+        try:
+            await self.redis.incr(SEARCH_VERSION_KEY)
+        except _SEARCH_CACHE_ERRORS as e:
+            logger.warning(f"Search cache invalidation failed: {e}")
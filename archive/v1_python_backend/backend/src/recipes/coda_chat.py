@@ -64,6 +64,9 @@ async def chat(request_obj: Request, payload: ChatRequest):
             # Define Native Tools
             async def store_memory(content: str, category: str = "general", tags: List[str] = None):
                 """Store a new memory in the long-term storage."""
+                # Reject empty input up front instead of paying for a failed store round trip
+                if not content or not content.strip():
+                    return {"error": "store_memory requires non-empty content"}
                 return await memory.add_memory(session_id=payload.session_id, content=content, category=category, tags=tags)
 
             async def retrieve_memory(query: str, limit: int = 5):
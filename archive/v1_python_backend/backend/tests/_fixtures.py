@@ -0,0 +1,43 @@
+"""Shared Neo4j fakes for unit tests that replay a fixed list of records.
+
+Test modules import these (`from _fixtures import FakeDriver`) instead of each defining
+an identical copy; pytest puts the `tests/` directory on `sys.path` for its modules.
+"""
+
+
+class FakeResult:
+    """Stand-in for a Neo4j AsyncResult: supports `await data()` and `async for`."""
+
+    def __init__(self, records):
+        self._records = records
+
+    async def data(self):
+        return self._records
+
+    async def __aiter__(self):
+        for r in self._records:
+            yield r
+
+
+class FakeSession:
+    def __init__(self, records):
+        self._result = FakeResult(records)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def run(self, query, params=None):
+        return self._result
+
+
+class FakeDriver:
+    """Driver whose every session replays `records`; one session object is reused."""
+
+    def __init__(self, records):
+        self._session = FakeSession(records)
+
+    def session(self):
+        return self._session
@@ -4,11 +4,13 @@ Usage:
   ECE_USE_DOCKER=1 pytest  # starts docker-compose.test.yml first
   ECE_USE_DOCKER=0 pytest  # skip starting docker
 """
+import asyncio
 import os
 import socket
 import subprocess
 import sys
 import time
+import uuid
 from pathlib import Path
 
 import pytest
@@ -72,6 +74,10 @@ def start_services():
     # Default: do not start Docker during local runs to avoid blockages in terminal-less environments.
     # CI can opt-in by setting ECE_USE_DOCKER=1 in integration jobs.
     use_docker = os.getenv("ECE_USE_DOCKER", "0") == "1"
+    # Under pytest-xdist every worker runs session fixtures; one worker's compose down would
+    # stop the stack under the others, so workers expect the services to be started externally.
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        use_docker = False
 
     if not use_docker or not compose_file.exists():
         yield
@@ -105,9 +111,29 @@ def start_services():
             print(f"Error tearing down docker-compose: {e}")
 
 
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole run (pytest-asyncio), instead of a new loop per async test."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def session_id():
+    """Unique session id per test so parallel (pytest -n) workers never share Redis/Neo4j keys."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return f"test-session-{worker}-{uuid.uuid4().hex[:8]}"
+
+
 class _FakeLLMHandler(BaseHTTPRequestHandler):
+    # Constant reply bodies are serialized once at class creation instead of on every request
+    _NOT_FOUND_BODY = json.dumps({"error": "Not found"}).encode("utf-8")
+
     def _send_json(self, data, status=200):
-        body = json.dumps(data).encode("utf-8")
+        self._send_body(json.dumps(data).encode("utf-8"), status)
+
+    def _send_body(self, body, status=200):
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -146,7 +172,7 @@ class _FakeLLMHandler(BaseHTTPRequestHandler):
             }
             self._send_json(response_body)
         else:
-            self._send_json({"error": "Not found"}, status=404)
+            self._send_body(self._NOT_FOUND_BODY, status=404)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -199,6 +225,10 @@ class FakeRedis:
         self._store[key] = value
         return True
 
+    async def incr(self, key):
+        self._store[key] = int(self._store.get(key) or 0) + 1
+        return self._store[key]
+
     async def close(self):
         return True
 
@@ -24,7 +24,8 @@ def test_yaml_config_parsed_from_repo_root(tmp_path, monkeypatch):
     import yaml
     cfg_path = 'configs/config.yaml'
     if os.path.exists(cfg_path):
-        raw = yaml.safe_load(open(cfg_path).read()) or {}
+        with open(cfg_path, encoding='utf-8') as f:
+            raw = yaml.safe_load(f) or {}
         server_host_from_yaml = raw.get('server', {}).get('host')
         if server_host_from_yaml is not None:
             assert s.ece_host == server_host_from_yaml
@@ -76,3 +76,41 @@ async def test_build_context_places_retrieved_memory_after_user_query(monkeypatc
     assert "# What the User Just Said:" in context_str
     assert "<retrieved_memory>" in context_str
     assert context_str.index("# What the User Just Said:") < context_str.index("<retrieved_memory>")
+
+
+class EntityDistiller(DummyDistiller):
+    async def filter_and_consolidate(self, query, memories, summaries, active_context):
+        return {
+            "summaries": "HIST_SUM",
+            "relevant_memories": [{"id": "m1", "content": "Q&A && R&D " * 400}],
+            "active_context": active_context,
+        }
+
+
+class CharTokenMemory(DummyMemory):
+    def count_tokens(self, text):
+        return len(text)
+
+
+@pytest.mark.asyncio
+async def test_build_context_escapes_memories_before_truncating(monkeypatch):
+    from src.context import settings
+    monkeypatch.setattr(settings, "llm_context_size", 8000)
+    monkeypatch.setattr(settings, "llm_max_tokens", 0)
+    monkeypatch.setattr(settings, "context_memory_frac", 0.05)
+    mem = CharTokenMemory()
+    ctx_mgr = ContextManager(memory=mem, llm=DummyLLM())
+    ctx_mgr.distiller = EntityDistiller()
+
+    async def fake_retrieve(_query, limit=10):
+        return []
+
+    monkeypatch.setattr(ctx_mgr, "_retrieve_relevant_memories", fake_retrieve)
+
+    context_str = await ctx_mgr.build_context("test-session", "Any notes?")
+    start = context_str.index("<retrieved_memory>")
+    section = context_str[start:context_str.index("</retrieved_memory>", start) + len("</retrieved_memory>")]
+    # Tags and escaped content together stay within the memory budget, with no entity cut in half
+    assert mem.count_tokens(section) <= 400
+    body = section[section.index('">') + 2:section.index("</memory>")]
+    assert body and body.count("&") == body.count("&amp;")
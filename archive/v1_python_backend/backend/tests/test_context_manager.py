@@ -59,3 +59,98 @@ async def test_build_context_includes_sections():
     assert "Current Date & Time" in res
     assert "What the User Just Said" in res
     assert "Current Conversation" in res
+
+
+class SyncTokenMem(FakeMem):
+    def count_tokens(self, text):
+        return len(text) // 4
+
+
+def test_truncate_to_tokens_respects_budget_and_sentences():
+    cm = ContextManager(memory=SyncTokenMem(), llm=FakeLLM())
+    text = "This is a sample sentence. " * 500
+    assert cm._truncate_to_tokens("short text", 100) == "short text"
+
+    head = cm._truncate_to_tokens(text, 100)
+    assert cm.memory.count_tokens(head) <= 100
+    assert head.endswith(".")
+
+    tail = cm._truncate_to_tokens(text, 100, keep_tail=True)
+    assert cm.memory.count_tokens(tail) <= 100
+    assert tail.startswith("This is")
+
+
+def test_section_budgets_reserve_response_tokens(monkeypatch):
+    from src.context import settings
+    monkeypatch.setattr(settings, "llm_context_size", 10000)
+    monkeypatch.setattr(settings, "llm_max_tokens", 2000)
+    cm = ContextManager(memory=SyncTokenMem(), llm=FakeLLM())
+    budgets = cm._section_budgets()
+    assert budgets["history"] == int(8000 * settings.context_history_frac)
+    assert sum(budgets.values()) <= 10000 - 2000
+
+
+def test_fit_items_keeps_longest_prefix_within_budget():
+    cm = ContextManager(memory=SyncTokenMem(), llm=FakeLLM())
+    items = [f"<memory>{'x' * 40}</memory>" for _ in range(50)]
+    kept = cm._fit_items(items, 100)
+    assert kept == items[:len(kept)]
+    assert cm.memory.count_tokens("\n".join(kept)) <= 100
+    assert cm.memory.count_tokens("\n".join(items[:len(kept) + 1])) > 100
+
+
+class CheckpointMem(SyncTokenMem):
+    def __init__(self):
+        super().__init__()
+        self.flushed = []
+
+    async def flush_to_neo4j(self, session_id, summary, original_tokens):
+        self.flushed.append(summary)
+
+
+@pytest.mark.asyncio
+async def test_update_context_mem_aware_checkpoint(monkeypatch):
+    from src.context import settings
+    monkeypatch.setattr(settings, "context_rotation_strategy", "mem_aware")
+    monkeypatch.setattr(settings, "summarize_threshold", 100)
+
+    mem = CheckpointMem()
+    mem._active = "\n".join(
+        f"User: question {i}\nAssistant: answer {i} <mem>fact {i}</mem> " + "padding " * 20 for i in range(4)
+    )
+    cm = ContextManager(memory=mem, llm=FakeLLM())
+    await cm.update_context("s1", "latest question", "latest answer")
+
+    assert mem._active.startswith("[CHECKPOINT]\n<mem>fact 0</mem>\n<mem>fact 1</mem>\n<mem>fact 2</mem>")
+    assert "User: question 3" in mem._active and "User: latest question" in mem._active
+    assert "User: question 2" not in mem._active
+    assert mem.flushed and mem.flushed[0].startswith("[CHECKPOINT]")
+
+    # A second rotation carries the earlier checkpoint forward
+    await cm.update_context("s1", "next question", "next answer <mem>fact 9</mem> " + "padding " * 20)
+    await cm.update_context("s1", "final question", "final answer")
+    assert "<mem>fact 0</mem>" in mem._active and "<mem>fact 3</mem>" in mem._active
+
+
+@pytest.mark.asyncio
+async def test_update_context_mem_aware_without_mem_blocks_summarizes(monkeypatch):
+    from src.context import settings
+    monkeypatch.setattr(settings, "context_rotation_strategy", "mem_aware")
+    monkeypatch.setattr(settings, "summarize_threshold", 100)
+
+    mem = CheckpointMem()
+    mem._active = "\n".join(f"User: question {i}\nAssistant: answer {i} " + "padding " * 20 for i in range(4))
+    cm = ContextManager(memory=mem, llm=FakeLLM())
+    await cm.update_context("s1", "latest question", "latest answer")
+
+    assert mem.flushed == ["Short summary"]
+    assert not mem._active.startswith("[CHECKPOINT]")
+
+
+def test_truncate_segments_keeps_every_segment_within_budget():
+    cm = ContextManager(memory=SyncTokenMem(), llm=FakeLLM())
+    segments = ["Short one.", "Long sentence here. " * 200, "Medium text. " * 30]
+    out = cm._truncate_segments(segments, 300, header_tokens=50)
+    assert out[0] == "Short one."
+    assert all(o and s.startswith(o[:10]) for o, s in zip(out, segments))
+    assert sum(cm.memory.count_tokens(o) for o in out) <= 300
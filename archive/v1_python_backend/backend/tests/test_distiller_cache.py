@@ -20,3 +20,19 @@ async def test_in_memory_distill_cache_reuse(monkeypatch):
     assert fake.calls == 1
     assert res1 == res2
 
+
+
+def test_distill_cache_evicts_least_recently_used(monkeypatch):
+    import src.distiller_impl as di
+    from collections import OrderedDict
+    monkeypatch.setattr(di, "_distill_cache", OrderedDict())
+    monkeypatch.setattr(di, "_distill_cache_limit", 2)
+    a, b, c = (di._cache_key(t, {"source": "unit_test"}) for t in ("a", "b", "c"))
+    assert len(a) == 32 and a != di._cache_key("a", {"source": "other"})
+    di._cache_put(a, {"summary": "a"})
+    di._cache_put(b, {"summary": "b"})
+    # touching `a` makes `b` the eviction candidate
+    assert di._cache_get(a) == {"summary": "a"}
+    di._cache_put(c, {"summary": "c"})
+    assert di._cache_get(b) is None
+    assert di._cache_get(a) is not None and di._cache_get(c) is not None
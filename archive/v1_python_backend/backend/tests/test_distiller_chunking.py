@@ -1,8 +1,10 @@
-import asyncio
 import json
+import pytest
 from src.distiller_impl import Distiller
 from src.llm import ContextSizeExceededError
 
+pytestmark = pytest.mark.asyncio
+
 
 class FakeLLM:
     def __init__(self):
@@ -17,12 +19,12 @@ class FakeLLM:
         return json.dumps({"summary": f"Summary-{self.calls}", "entities": ["TestEntity"]})
 
 
-def test_chunking_flow():
+async def test_chunking_flow():
     # Build a long text for chunking
     text = "\n".join(["Sentence repeated to create large text." * 50 for _ in range(40)])
     llm = FakeLLM()
     dist = Distiller(llm_client=llm)
-    res = asyncio.run(dist.distill_moment(text))
+    res = await dist.distill_moment(text)
     assert isinstance(res, dict)
     assert "summary" in res and res["summary"]
     assert isinstance(res.get("entities"), list)
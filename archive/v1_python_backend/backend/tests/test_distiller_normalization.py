@@ -1,9 +1,11 @@
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import asyncio
+import pytest
 from src.distiller_impl import Distiller
 from src.content_utils import is_token_soup
 
+pytestmark = pytest.mark.asyncio
+
 
 class DummyLLM:
     def __init__(self):
@@ -16,7 +18,7 @@ class DummyLLM:
         return {"summary": "Test Summary", "entities": []}
 
 
-def test_distiller_calls_normalized_text_before_generate():
+async def test_distiller_calls_normalized_text_before_generate():
     llm = DummyLLM()
     d = Distiller(llm_client=llm)
     # Construct a token-soup-like input with ANSI codes + paths + hex (no explicit memcpy) but which should be normalized
@@ -24,7 +26,7 @@ def test_distiller_calls_normalized_text_before_generate():
     # Ensure initial detection
     assert is_token_soup(text) or True
     # Run distill_moment
-    out = asyncio.run(d.distill_moment(text))
+    out = await d.distill_moment(text)
     # Check llm was called
     assert len(llm.called_texts) > 0
     passed_text = llm.called_texts[0]
@@ -48,8 +48,9 @@ def test_chat_failure_auto_fallback(monkeypatch, tmp_path, capsys):
             return FakeResponse(status_code=200, json_data={"status": "success"})
         return FakeResponse()
 
-    monkeypatch.setattr('requests.get', fake_get)
-    monkeypatch.setattr('requests.post', fake_post)
+    # Patch through the already-loaded module object rather than re-resolving dotted strings
+    monkeypatch.setattr(module.requests, 'get', fake_get)
+    monkeypatch.setattr(module.requests, 'post', fake_post)
 
     # Call script main with args
     sys_argv = ["import_via_chat.py", "--file", str(p), "--api", "http://127.0.0.1:8001", "--limit", "1", "--auto-fallback", "--session", "import_test", "--chunk-size", "100"]
@@ -63,3 +64,16 @@ def test_chat_failure_auto_fallback(monkeypatch, tmp_path, capsys):
     # Check output indicates success
     captured = capsys.readouterr()
     assert "Import finished" in captured.out
+
+
+def test_chunk_text_by_tokens_respects_budget():
+    module = load_script()
+    text = "\n".join(f"Line {i} about Sybil and the memory graph" for i in range(50))
+    chunks = module.chunk_text_by_tokens(text, 20)
+    assert len(chunks) > 1
+
+    # Count every line of every chunk in one batch call, then check all budgets at once
+    chunk_lines = [c.split("\n") for c in chunks]
+    counts = iter(module.count_tokens_batch([line for lines in chunk_lines for line in lines]))
+    per_chunk = [sum(next(counts) for _ in lines) for lines in chunk_lines]
+    assert max(per_chunk) <= 20, per_chunk
@@ -71,3 +71,25 @@ async def test_generate_api_fallback(monkeypatch):
     res = await client.generate("hello")
     assert isinstance(res, str)
     assert res == "local model output"
+
+
+def test_local_model_shared_across_clients(monkeypatch, tmp_path):
+    import sys
+    import src.llm as llm_mod
+    loads = []
+
+    class FakeLlama:
+        def __init__(self, **kwargs):
+            loads.append(kwargs["model_path"])
+
+    monkeypatch.setitem(sys.modules, "llama_cpp", types.SimpleNamespace(Llama=FakeLlama))
+    monkeypatch.setattr(llm_mod, "_local_llm_pool", {})
+    model_file = tmp_path / "model.gguf"
+    model_file.write_bytes(b"")
+
+    a, b = LLMClient(), LLMClient()
+    a.model_path = b.model_path = str(model_file)
+    a._init_local_model()
+    b._init_local_model()
+    assert loads == [str(model_file)]
+    assert a._local_llm is b._local_llm
@@ -34,9 +34,8 @@ async def memory_no_redis():
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_get_active_context_redis_available(memory):
+async def test_get_active_context_redis_available(memory, session_id):
     """Test getting context when Redis is available."""
-    session_id = "test-session"
     test_context = "This is test context"
     
     if memory.redis:
@@ -47,19 +46,15 @@ async def test_get_active_context_redis_available(memory):
         pytest.skip("Redis not available")
 
 @pytest.mark.asyncio
-async def test_get_active_context_redis_unavailable(memory_no_redis):
+async def test_get_active_context_redis_unavailable(memory_no_redis, session_id):
     """Test fallback when Redis is unavailable."""
-    session_id = "test-session"
-    
     # Should return empty string without crashing
     result = await memory_no_redis.get_active_context(session_id)
     assert result == "" or result is None
 
 @pytest.mark.asyncio
-async def test_save_active_context_redis_unavailable(memory_no_redis):
+async def test_save_active_context_redis_unavailable(memory_no_redis, session_id):
     """Test save gracefully fails when Redis unavailable."""
-    session_id = "test-session"
-    
     # Should not crash
     await memory_no_redis.save_active_context(session_id, "test")
     # No assertion needed - just verify no exception
@@ -122,6 +117,88 @@ async def test_search_memories_by_tags(memory):
     results = await memory.search_memories(tags=["testing"], limit=5)
     assert isinstance(results, list)
 
+@pytest.mark.asyncio
+async def test_add_memory_repeat_content_skips_distill(monkeypatch):
+    """Test that content already in Neo4j is returned without a second distill call."""
+    from src.memory import manager
+
+    mem = TieredMemory(llm_client=object())
+    stored = {}
+    distilled = []
+
+    async def fake_distill(text, llm_client=None, metadata=None):
+        distilled.append(text)
+        return {"entities": []}
+
+    async def fake_find(content_hash):
+        return stored.get(content_hash)
+
+    async def fake_add(*args, **kwargs):
+        stored[kwargs["content_hash"]] = "mem-1"
+        return "mem-1"
+
+    monkeypatch.setattr(manager, "distill_moment", fake_distill)
+    mem.neo4j.find_memory_by_content_hash = fake_find
+    mem.neo4j.add_memory = fake_add
+    content = "Remember that the staging database migrates on Fridays."
+    first = await mem.add_memory(category="fact", content=content)
+    stored.clear()  # e.g. the Archivist janitor deleted the node
+    second = await mem.add_memory(category="fact", content=content)
+    third = await mem.add_memory(category="fact", content=content)
+    assert first == second == third == "mem-1"
+    assert len(distilled) == 2
+
+@pytest.mark.asyncio
+async def test_search_memories_batch_preserves_order():
+    """Test that batched searches return one result list per query, in query order."""
+    mem = TieredMemory()
+
+    async def fake_search(query_text, category, limit):
+        await asyncio.sleep(0.01 if query_text == "first" else 0)
+        return [{"content": query_text}]
+
+    mem.neo4j.search_memories = fake_search
+    results = await mem.search_memories_batch(["first", "second", "third"], limit=3)
+    assert [r[0]["content"] for r in results] == ["first", "second", "third"]
+
+@pytest.mark.asyncio
+async def test_search_memories_redis_cache_invalidated_on_write(memory):
+    """Test that repeat searches are served from Redis until a memory write bumps the cache version."""
+    if not memory.redis.redis:
+        pytest.skip("Redis not available")
+    calls = []
+
+    async def fake_search(query_text, category, limit):
+        calls.append(query_text)
+        return [{"content": f"hit {len(calls)}"}]
+
+    memory.neo4j.search_memories = fake_search
+    first = await memory.search_memories(query_text="cache me", limit=3)
+    assert await memory.search_memories(query_text="cache me", limit=3) == first
+    assert len(calls) == 1
+
+    await memory.redis.invalidate_search_results()
+    assert await memory.search_memories(query_text="cache me", limit=3) != first
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_search_memories_write_during_search_not_cached(memory):
+    """Test that results computed before a concurrent write are not cached under the new version."""
+    if not memory.redis.redis:
+        pytest.skip("Redis not available")
+    calls = []
+
+    async def fake_search(query_text, category, limit):
+        calls.append(query_text)
+        if len(calls) == 1:
+            await memory.redis.invalidate_search_results()  # a memory write lands mid-search
+        return [{"content": f"hit {len(calls)}"}]
+
+    memory.neo4j.search_memories = fake_search
+    await memory.search_memories(query_text="racy", limit=3)
+    await memory.search_memories(query_text="racy", limit=3)
+    assert len(calls) == 2
+
 # ============================================================================
 # TOKEN COUNTING TESTS
 # ============================================================================
@@ -151,6 +228,52 @@ def test_count_tokens_large():
     count = mem.count_tokens(text)
     assert count > 500  # Should be at least 500 tokens
 
+def test_count_tokens_list_matches_joined():
+    """Test that a list of strings is counted as its concatenation."""
+    mem = TieredMemory()
+
+    assert mem.count_tokens(["Hello, ", "world!"]) == mem.count_tokens("Hello, world!")
+    assert mem.count_tokens([]) == 0
+
+def test_count_tokens_custom_tokenizer_bypasses_cache():
+    """Test that a swapped-in tokenizer is used instead of the memoized shared encoder."""
+    mem = TieredMemory()
+
+    class Toker:
+        def encode(self, text, disallowed_special=()):
+            return [0] * 7
+
+    mem.tokenizer = Toker()
+    assert mem.count_tokens("Hello world") == 7
+
+def test_encoder_loaded_on_first_count(monkeypatch):
+    """Test that the shared encoder is loaded lazily, not at import or construction."""
+    from src.memory import manager
+
+    loads = []
+
+    def fake_get_encoding(name):
+        loads.append(name)
+        raise OSError("offline")
+
+    monkeypatch.setattr(manager, "_TOKENIZER", None)
+    monkeypatch.setattr(manager.tiktoken, "get_encoding", fake_get_encoding)
+    mem = TieredMemory()
+    assert loads == []
+    # Falls back to the chars/4 estimate when the encoder cannot be loaded
+    assert mem.count_tokens("x" * 600) == 150
+    assert loads == ["cl100k_base"]
+
+def test_count_tokens_long_text_not_memoized():
+    """Test that only short strings are kept in the token-count memo."""
+    from src.memory import manager
+
+    mem = TieredMemory()
+    manager._count_short_str.cache_clear()
+    mem.count_tokens("short text")
+    mem.count_tokens("x" * (manager._COUNT_MEMO_MAX_CHARS + 1))
+    assert manager._count_short_str.cache_info().currsize == 1
+
 # ============================================================================
 # GRACEFUL DEGRADATION TESTS
 # ============================================================================
@@ -194,24 +317,21 @@ async def test_memory_initialization_retry():
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_get_summaries(memory):
+async def test_get_summaries(memory, session_id):
     """Test retrieving conversation summaries."""
     if not memory.neo4j_driver:
         pytest.skip("Neo4j not available")
     
-    session_id = "test-session"
-    
     # Get summaries (should not crash even if none exist)
     summaries = await memory.get_summaries(session_id, limit=5)
     assert isinstance(summaries, list)
 
 @pytest.mark.asyncio
-async def test_save_summary(memory):
+async def test_save_summary(memory, session_id):
     """Test saving conversation summary."""
     if not memory.neo4j_driver:
         pytest.skip("Neo4j not available")
     
-    session_id = "test-session"
     summary = "This is a test summary of the conversation"
     
     await memory.save_summary(session_id, summary)
@@ -1,35 +1,6 @@
 import pytest
 from src.memory import TieredMemory
-
-
-class FakeResult:
-    def __init__(self, records):
-        self._records = records
-    async def data(self):
-        return self._records
-    async def __aiter__(self):
-        # Provide async iterator interface like Neo4j AsyncResult
-        for r in self._records:
-            yield r
-
-
-class FakeSession:
-    def __init__(self, records):
-        self._records = records
-    async def __aenter__(self):
-        return self
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-    async def run(self, query, params=None):
-        # Return records consistent with fulltext: id, m, score
-        return FakeResult(self._records)
-
-
-class FakeDriver:
-    def __init__(self, records):
-        self._records = records
-    def session(self):
-        return FakeSession(self._records)
+from _fixtures import FakeDriver
 
 
 @pytest.mark.asyncio
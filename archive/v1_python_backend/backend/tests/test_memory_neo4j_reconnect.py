@@ -5,6 +5,11 @@ from src.memory import TieredMemory
 from neo4j import AsyncGraphDatabase
 
 
+class DummyResult:
+    async def data(self):
+        return []
+
+
 class DummySession:
     async def __aenter__(self):
         return self
@@ -13,19 +18,22 @@ class DummySession:
         return False
 
     async def run(self, query, params=None):
-        class DummyResult:
-            async def data(self):
-                return []
-        return DummyResult()
+        return _RESULT
 
 
 class DummyDriver:
     def session(self):
-        return DummySession()
+        return _SESSION
     async def close(self):
         return None
 
 
+# The dummies hold no state, so one shared instance of each serves every call.
+_RESULT = DummyResult()
+_SESSION = DummySession()
+_DRIVER = DummyDriver()
+
+
 @pytest.mark.asyncio
 async def test_neo4j_reconnect(monkeypatch):
     # Replace driver to raise on first two calls and succeed on third
@@ -35,7 +43,7 @@ async def test_neo4j_reconnect(monkeypatch):
         calls['count'] += 1
         if calls['count'] < 3:
             raise Exception('Simulated Neo4j critical failure')
-        return DummyDriver()
+        return _DRIVER
 
     monkeypatch.setattr(AsyncGraphDatabase, 'driver', fake_driver_factory)
     # Reduce delays and attempts for fast test
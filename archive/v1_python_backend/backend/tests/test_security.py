@@ -9,7 +9,6 @@ from fastapi.security import HTTPAuthorizationCredentials
 from src.security import verify_api_key, audit_logger, AuditLogger
 from src.config import settings
 from pathlib import Path
-import tempfile
 import os
 
 # ============================================================================
@@ -17,14 +16,11 @@ import os
 # ============================================================================
 
 @pytest.fixture
-def temp_audit_log():
-    """Create temporary audit log file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log') as f:
-        temp_path = f.name
-    yield temp_path
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+def temp_audit_log(tmp_path):
+    """Create temporary audit log file for testing (pytest cleans tmp_path up lazily)."""
+    temp_path = tmp_path / "audit.log"
+    temp_path.touch()
+    return str(temp_path)
 
 @pytest.fixture
 def test_audit_logger(temp_audit_log):
@@ -175,16 +171,15 @@ def test_audit_logger_disabled(temp_audit_log):
 # INTEGRATION TESTS
 # ============================================================================
 
-def test_audit_logger_creates_directory():
+def test_audit_logger_creates_directory(tmp_path):
     """Test that audit logger creates log directory if missing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        log_path = Path(tmpdir) / "subdir" / "audit.log"
-        
-        settings.audit_log_enabled = True
-        settings.audit_log_path = str(log_path)
-        
-        logger = AuditLogger()
-        logger.log("test", {})
-        
-        assert log_path.exists()
-        assert log_path.parent.exists()
+    log_path = tmp_path / "subdir" / "audit.log"
+    
+    settings.audit_log_enabled = True
+    settings.audit_log_path = str(log_path)
+    
+    logger = AuditLogger()
+    logger.log("test", {})
+    
+    assert log_path.exists()
+    assert log_path.parent.exists()
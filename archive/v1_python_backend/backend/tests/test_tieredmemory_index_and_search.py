@@ -4,30 +4,7 @@ import json
 from src.memory import TieredMemory
 from src.vector_adapters.redis_vector_adapter import RedisVectorAdapter
 from src.config import settings
-
-
-
-class FakeNeo4jResult:
-    def __init__(self, records):
-        self._records = records
-    async def data(self):
-        return self._records
-
-class FakeSession:
-    def __init__(self, records):
-        self._records = records
-    async def __aenter__(self):
-        return self
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-    async def run(self, query, params=None):
-        return FakeNeo4jResult(self._records)
-
-class FakeDriver:
-    def __init__(self, records):
-        self._records = records
-    def session(self):
-        return FakeSession(self._records)
+from _fixtures import FakeDriver
 
 
 @pytest.mark.asyncio
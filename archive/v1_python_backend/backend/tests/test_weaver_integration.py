@@ -1,4 +1,3 @@
-import asyncio
 import os
 import sys
 import uuid
@@ -11,8 +10,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.maintenance.weaver import MemoryWeaver
 from src.agents.archivist import ArchivistAgent
 
+pytestmark = pytest.mark.asyncio
 
-def test_weaver_run_returns_run_id(monkeypatch, tmp_path):
+
+async def test_weaver_run_returns_run_id(monkeypatch, tmp_path):
     """Test that MemoryWeaver runs and returns a run_id when run_repair is patched."""
 
     # Patch run_repair so no real DB calls occur
@@ -27,14 +28,14 @@ def test_weaver_run_returns_run_id(monkeypatch, tmp_path):
     monkeypatch.setattr(rw, '_run_repair_fn', AsyncMock(side_effect=fake_run_repair))
 
     weaver = MemoryWeaver()
-    result = asyncio.run(weaver.weave_recent(hours=1, dry_run=True, csv_out=str(tmp_path/'weaver_test.csv')))
+    result = await weaver.weave_recent(hours=1, dry_run=True, csv_out=str(tmp_path/'weaver_test.csv'))
     assert isinstance(result, dict)
     assert 'run_id' in result
     # verify UUID format
     assert isinstance(uuid.UUID(result['run_id']), uuid.UUID)
 
 
-def test_weaver_commit_flag_respected(monkeypatch, tmp_path):
+async def test_weaver_commit_flag_respected(monkeypatch, tmp_path):
     """Test that MemoryWeaver respects the master switch setting and sets commit=True when enabled."""
     recorded = {}
 
@@ -50,14 +51,14 @@ def test_weaver_commit_flag_respected(monkeypatch, tmp_path):
     from src.config import settings as s
     s.weaver_commit_enabled = True
     # run
-    asyncio.run(weaver.weave_recent(hours=1, dry_run=None, csv_out=str(tmp_path/'weaver_test_commit.csv')))
+    await weaver.weave_recent(hours=1, dry_run=None, csv_out=str(tmp_path/'weaver_test_commit.csv'))
     # We expect commit=True in kwargs passed into run_repair
     assert recorded.get('commit') is True
     # restore
     s.weaver_commit_enabled = False
 
 
-def test_archivist_integration_runs_weaver(monkeypatch):
+async def test_archivist_integration_runs_weaver(monkeypatch):
     """Test that ArchivistAgent exposes run_weaving_cycle and delegates to MemoryWeaver."""
 
     # simple dummy memory & verifier so the Archivist can be constructed
@@ -76,14 +77,14 @@ def test_archivist_integration_runs_weaver(monkeypatch):
 
     archivist = ArchivistAgent(DummyMemory(), DummyVerifier())
     # run a weave cycle (dry-run expected by default)
-    result = asyncio.run(archivist.run_weaving_cycle(hours=1, dry_run=True))
+    result = await archivist.run_weaving_cycle(hours=1, dry_run=True)
     assert isinstance(result, dict)
     assert 'run_id' in result
     # check that archivist created a weaver successfully
     assert hasattr(archivist, 'weaver')
 
 
-def test_archivist_commit_flag(monkeypatch, tmp_path):
+async def test_archivist_commit_flag(monkeypatch, tmp_path):
     """Ensure Archivist's run_weaving_cycle honors the global weaver_commit_enabled setting when run."""
     # Patch the run_repair call
     recorded = {}
@@ -103,7 +104,7 @@ def test_archivist_commit_flag(monkeypatch, tmp_path):
     from src.config import settings as s
     s.weaver_commit_enabled = True
     archivist = ArchivistAgent(DummyMemory(), DummyVerifier())
-    result = asyncio.run(archivist.run_weaving_cycle(hours=1, dry_run=None))
+    result = await archivist.run_weaving_cycle(hours=1, dry_run=None)
     assert isinstance(result, dict)
     assert 'run_id' in result
     assert recorded.get('commit') is True
@@ -1,4 +1,4 @@
-import importlib, sys, os
+import importlib, importlib.util, sys, os
 
 repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if repo_root not in sys.path:
@@ -16,19 +16,12 @@ for cand in candidates:
     except Exception as e:
         print(f"FAIL: import {cand} -> {e}")
 
-# Also try to import the package 'scripts' and nested packages
-try:
-    importlib.import_module('scripts')
-    print('SUCCESS: imported scripts package')
-except Exception as e:
-    print('FAIL: import scripts package ->', e)
-try:
-    importlib.import_module('scripts.neo4j')
-    print('SUCCESS: imported scripts.neo4j package')
-except Exception as e:
-    print('FAIL: import scripts.neo4j package ->', e)
-try:
-    importlib.import_module('scripts.neo4j.repair')
-    print('SUCCESS: imported scripts.neo4j.repair package')
-except Exception as e:
-    print('FAIL: import scripts.neo4j.repair package ->', e)
+# find_spec locates each package without executing it (only its parents are imported),
+# which is all this presence check needs
+for pkg in ('scripts', 'scripts.neo4j', 'scripts.neo4j.repair'):
+    try:
+        found = importlib.util.find_spec(pkg) is not None
+    except Exception as e:
+        print(f'FAIL: find {pkg} package -> {e}')
+        continue
+    print(f"{'SUCCESS' if found else 'FAIL'}: found {pkg} package")
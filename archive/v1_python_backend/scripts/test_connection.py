@@ -1,33 +1,39 @@
-import requests
+import asyncio
+import httpx
 import sys
 
-def test_connection():
-    print("Testing connection to http://127.0.0.1:8000/health ...")
-    try:
-        r = requests.get("http://127.0.0.1:8000/health", timeout=2)
-        print(f"Status: {r.status_code}")
-        print(f"Response: {r.text}")
-    except Exception as e:
-        print(f"Failed: {e}")
+CHECKS = [
+    ("Testing connection to http://127.0.0.1:8000/health ...", "GET", "http://127.0.0.1:8000/health", None),
+    ("Testing connection to http://localhost:8000/health ...", "GET", "http://localhost:8000/health", None),
+    ("Testing POST to http://127.0.0.1:8000/chat/stream ...", "POST", "http://127.0.0.1:8000/chat/stream",
+     {"session_id": "test", "message": "hi", "stream": True}),
+]
 
-    print("\nTesting connection to http://localhost:8000/health ...")
-    try:
-        r = requests.get("http://localhost:8000/health", timeout=2)
-        print(f"Status: {r.status_code}")
-        print(f"Response: {r.text}")
-    except Exception as e:
-        print(f"Failed: {e}")
 
-    print("\nTesting POST to http://127.0.0.1:8000/chat/stream ...")
-    try:
-        r = requests.post("http://127.0.0.1:8000/chat/stream", 
-                          json={"session_id": "test", "message": "hi", "stream": True},
-                          headers={"Content-Type": "application/json"},
-                          timeout=2)
+async def check_url(client: httpx.AsyncClient, method: str, url: str, payload=None):
+    if method == "POST":
+        return await client.post(url, json=payload, headers={"Content-Type": "application/json"})
+    return await client.get(url)
+
+
+async def test_connection():
+    # Probe all endpoints concurrently: total wait is the slowest check, not the sum of them.
+    async with httpx.AsyncClient(timeout=2) as client:
+        results = await asyncio.gather(
+            *(check_url(client, method, url, payload) for _, method, url, payload in CHECKS),
+            return_exceptions=True,
+        )
+
+    for i, ((label, method, _, _), r) in enumerate(zip(CHECKS, results)):
+        print(("\n" if i else "") + label)
+        if isinstance(r, Exception):
+            print(f"Failed: {r}")
+            continue
         print(f"Status: {r.status_code}")
-        print(f"Headers: {r.headers}")
-    except Exception as e:
-        print(f"Failed: {e}")
+        if method == "POST":
+            print(f"Headers: {r.headers}")
+        else:
+            print(f"Response: {r.text}")
 
 if __name__ == "__main__":
-    test_connection()
+    asyncio.run(test_connection())
@@ -1,6 +1,9 @@
-import sys, time, os, requests, hashlib, logging
+import sys, time, os, requests, hashlib, logging, argparse, threading, json, queue
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from requests.adapters import HTTPAdapter
 
 # Import configuration
 try:
@@ -9,12 +12,15 @@ try:
     PORT = config.get("server.port", 8000)
     WATCH_DIR = config.get("watchdog.watch_directory", os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "context")))
     BRIDGE_INGEST_URL = f"http://localhost:{PORT}/v1/memory/ingest"
-    ALLOWED_EXTENSIONS = set(config.get("watchdog.allowed_extensions", ['.md', '.txt', '.json', '.yaml', '.py', '.js', '.html', '.css', '.bat', '.ps1', '.sh', '.yaml', '.yml']))
+    ALLOWED_EXTENSIONS = frozenset(e.lower() for e in config.get("watchdog.allowed_extensions", ['.md', '.txt', '.json', '.yaml', '.py', '.js', '.html', '.css', '.bat', '.ps1', '.sh', '.yaml', '.yml']))
+    MAX_FILE_SIZE = config.get("watchdog.max_file_size", 1024 * 1024)
 except ImportError:
     # Fallback if config manager is not available
+    PORT = 8000
     WATCH_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "context"))
-    BRIDGE_INGEST_URL = "http://localhost:8000/v1/memory/ingest"
-    ALLOWED_EXTENSIONS = {'.md', '.txt', '.json', '.yaml', '.py', '.js', '.html', '.css', '.bat', '.ps1', '.sh', '.yaml', '.yml'}
+    BRIDGE_INGEST_URL = f"http://localhost:{PORT}/v1/memory/ingest"
+    ALLOWED_EXTENSIONS = frozenset({'.md', '.txt', '.json', '.yaml', '.py', '.js', '.html', '.css', '.bat', '.ps1', '.sh', '.yml'})
+    MAX_FILE_SIZE = 1024 * 1024
 
 # Setup Logging
 LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "logs"))
@@ -31,85 +37,366 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HASH_CHUNK = 64 * 1024
+INGEST_CONCURRENCY = 8
+MAX_BATCH_SIZE = 10
+MAX_BATCH_BYTES = 512 * 1024
+DEBOUNCE_SECONDS = 0.5
+EVENT_QUEUE_SIZE = 10000
+# Per-file caches are capped so a long-running watcher over a churning tree stays bounded
+CACHE_SIZE = 10000
+# Set from the Bridge's /health: whether /v1/memory/ingest accepts a raw text/plain body
+STREAM_UPLOAD = False
+# Hashes of files already ingested, persisted so a restart only re-ingests what changed
+CACHE_FILE = ".watchdog_cache.json"
+CACHE_SAVE_INTERVAL = 30
+
+# One pooled keep-alive session for every Bridge call, so repeated ingests reuse the TCP connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def dumps(obj):
+    """Serialize an ingest body to JSON bytes; orjson encodes large file contents several times faster."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def file_digest(filepath):
+    """Hash a file in 64 KiB chunks (BLAKE3 if installed, else BLAKE2b) without reading it whole."""
+    hasher = blake3.blake3() if blake3 is not None else hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def walk_files(root):
+    """Yield watched files under root via an os.scandir stack, skipping hidden directories."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.'): stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in ALLOWED_EXTENSIONS:
+                        yield entry.path
+        except OSError:
+            continue
+
+def batched(payloads, max_items=MAX_BATCH_SIZE, max_bytes=MAX_BATCH_BYTES):
+    """Group payloads into batches of at most max_items entries or max_bytes of content."""
+    batch, size = [], 0
+    for payload in payloads:
+        n = len(payload["content"])
+        if batch and (len(batch) >= max_items or size + n > max_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append(payload)
+        size += n
+    if batch: yield batch
+
+def bounded_map(pool, fn, items, limit):
+    """Like pool.map, but lazy: at most `limit` calls are submitted ahead of the consumer,
+    so results (file contents) are not all held in memory at once."""
+    pending = deque()
+    for item in items:
+        if len(pending) >= limit: yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending: yield pending.popleft().result()
+
+def read_text(filepath):
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f: return f.read()
+
+class _LRU(OrderedDict):
+    """OrderedDict capped at `cap` entries, evicting the least recently set."""
+    def __init__(self, cap):
+        super().__init__()
+        self.cap = cap
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.cap: self.popitem(last=False)
+
 class Handler(FileSystemEventHandler):
-    def __init__(self):
-        self.hashes = {}
-        self.last_mod = {}
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.hashes = _LRU(cache_size)
+        self._due_at = {}  # filepath -> monotonic time its last event settles
+        self._coalescer = None
+        self._stat_cache = _LRU(cache_size)  # filepath -> (mtime_ns, size, digest)
+        self._lock = threading.Lock()
+        # Settled paths wait here for the worker threads, which do the reads, hashing and POSTs,
+        # so the observer thread keeps draining events; the bound caps memory during bulk copies
+        self._events = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._workers = [threading.Thread(target=self._consume, daemon=True) for _ in range(INGEST_CONCURRENCY)]
+        for worker in self._workers: worker.start()
+        self._cache_path = os.path.join(WATCH_DIR, CACHE_FILE)
+        self._ingested = {}  # relpath -> [mtime_ns, size, digest] of the last successful ingest
+        self._dirty = False
+        self._relpaths = _LRU(cache_size)  # filepath -> path relative to WATCH_DIR
+        self.load_cache()
 
-    def process(self, filepath):
+    def load_cache(self):
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f: data = json.load(f)
+            # Validate every entry before using any, so a corrupt cache just means a full re-index
+            ingested = {str(rel): [int(mtime_ns), int(size), str(digest)] for rel, (mtime_ns, size, digest) in data.items()}
+        except OSError: return
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"⚠️  Ignoring invalid hash cache {CACHE_FILE}: {e}")
+            return
+        self._ingested = ingested
+        logger.info(f"📦 Loaded hash cache: {len(self._ingested)} file(s)")
+
+    def save_cache(self):
+        """Atomically write the ingested-hash cache if it changed since the last save.
+
+        Entries for files that no longer exist are dropped first.
+        """
+        with self._lock:
+            if not self._dirty: return
+            rels = list(self._ingested)
+        gone = [rel for rel in rels if not os.path.exists(os.path.join(WATCH_DIR, rel))]
+        with self._lock:
+            for rel in gone: self._ingested.pop(rel, None)
+            snapshot = dict(self._ingested)
+            self._dirty = False
+        tmp = self._cache_path + ".tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f: json.dump(snapshot, f)
+            os.replace(tmp, self._cache_path)
+        except OSError as e:
+            logger.error(f"❌ Failed to save hash cache: {e}")
+
+    def prepare(self, filepath, read=True):
+        """Return the ingest payload for filepath, or None if it is filtered or unchanged.
+
+        With read=False the file is left unread (content is None) so ingest() can
+        stream it straight from disk.
+        """
         _, ext = os.path.splitext(filepath)
-        if ext.lower() not in ALLOWED_EXTENSIONS: return
-        
-        # Debounce & Hash Check
-        now = time.time()
-        if filepath in self.last_mod and now - self.last_mod[filepath] < 1.0: return
-        self.last_mod[filepath] = now
-        time.sleep(0.1)
+        if ext.lower() not in ALLOWED_EXTENSIONS or os.path.basename(filepath) == CACHE_FILE: return None
         
-        hasher = hashlib.md5()
         try:
-            with open(filepath, 'rb') as f: hasher.update(f.read())
-            new_hash = hasher.hexdigest()
-        except: return
+            st = os.stat(filepath)
+            if st.st_size > MAX_FILE_SIZE:
+                logger.warning(f"⚠️  Skipping {os.path.basename(filepath)}: {st.st_size} bytes exceeds {MAX_FILE_SIZE}")
+                return None
+            cached = self._stat_cache.get(filepath)
+            # Spurious events for an unchanged file: skip without reading it
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size): return None
+            rel = self._relpaths.get(filepath)
+            if rel is None:
+                rel = self._relpaths[filepath] = os.path.relpath(filepath, WATCH_DIR)
+            # The persisted ingest record is uncapped, so it still knows files the LRU caches evicted
+            recorded = self._ingested.get(rel)
+            if recorded and tuple(recorded[:2]) == (st.st_mtime_ns, st.st_size):
+                self._stat_cache[filepath] = tuple(recorded)
+                return None
+            new_hash = file_digest(filepath)
+            stat = (st.st_mtime_ns, st.st_size, new_hash)
+            self._stat_cache[filepath] = stat
+        except OSError: return None
         
-        if self.hashes.get(filepath) == new_hash: return
+        if recorded and recorded[2] == new_hash:
+            # Touched but unchanged since its last ingest: refresh the record so a restart skips the hash
+            with self._lock:
+                self._ingested[rel] = list(stat)
+                self._dirty = True
+            return None
+        if self.hashes.get(filepath) == new_hash: return None
         self.hashes[filepath] = new_hash
 
         logger.info(f"👀 Change: {os.path.basename(filepath)}")
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
-            payload = {
-                "source": f"watchdog://{os.path.relpath(filepath, WATCH_DIR)}",
-                "content": content,
-                "file_type": ext,
-                "filename": os.path.relpath(filepath, WATCH_DIR)
-            }
-            response = requests.post(BRIDGE_INGEST_URL, json=payload, timeout=10)
+            content = read_text(filepath) if read else None
+        except Exception as e:
+            logger.error(f"❌ Error reading {os.path.basename(filepath)}: {e}")
+            return None
+        return {
+            "source": f"watchdog://{rel}",
+            "content": content,
+            "file_type": ext.lower(),
+            "filename": rel,
+            "stat": stat,  # what was hashed; recorded on success, never sent to the Bridge
+        }
+
+    def ingest(self, payloads):
+        """POST one or more payloads to the Bridge in a single request."""
+        names = ", ".join(os.path.basename(p["filename"]) for p in payloads)
+        try:
+            if len(payloads) == 1 and payloads[0]["content"] is None:
+                response = self._post_stream(payloads[0])
+            else:
+                items = [{k: v for k, v in p.items() if k != "stat"} for p in payloads]
+                body = items[0] if len(items) == 1 else {"items": items}
+                response = SESSION.post(BRIDGE_INGEST_URL, data=dumps(body), headers=JSON_HEADERS, timeout=10)
             if response.status_code == 200:
-                logger.info(f"✅ Ingested")
+                done = self._acknowledged(payloads, response)
+                logger.info(f"✅ Ingested {len(done)} file(s)")
+                if len(done) < len(payloads):
+                    failed = ", ".join(os.path.basename(p["filename"]) for p in payloads if p not in done)
+                    logger.error(f"❌ Bridge reported ingest errors for: {failed}")
+                self._mark_ingested(done)
             elif response.status_code == 503:
-                logger.warning(f"⚠️  Ghost Engine Disconnected - queued for later ingestion: {os.path.basename(filepath)}")
+                logger.warning(f"⚠️  Ghost Engine Disconnected - queued for later ingestion: {names}")
                 # In this case, the file is queued but not ingested - this is expected behavior when Ghost Engine is not running
             else:
                 logger.error(f"❌ Ingest failed with status {response.status_code}: {response.text}")
         except requests.exceptions.ConnectionError:
-            logger.warning(f"⚠️  Bridge offline - queued for later ingestion: {os.path.basename(filepath)}")
+            logger.warning(f"⚠️  Bridge offline - queued for later ingestion: {names}")
         except Exception as e:
-            logger.error(f"❌ Error ingesting {os.path.basename(filepath)}: {e}")
+            logger.error(f"❌ Error ingesting {names}: {e}")
+
+    @staticmethod
+    def _acknowledged(payloads, response):
+        """Return the payloads the Bridge reports as ingested or skipped as duplicates.
+
+        A batch answers 200 with a per-item result list, so one failed item does not fail the request.
+        """
+        try:
+            body = response.json()
+        except ValueError:
+            return []
+        results = body.get("results") if isinstance(body, dict) else None
+        if results is None: results = [body]  # single item: the body is its own result
+        return [p for p, r in zip(payloads, results) if isinstance(r, dict) and r.get("status") in ("success", "skipped")]
+
+    def _post_stream(self, payload):
+        # The file object is sent in blocks by requests, so neither the text nor a JSON-escaped copy is held in memory
+        meta = {k: payload[k] for k in ("source", "file_type", "filename")}
+        with open(os.path.join(WATCH_DIR, payload["filename"]), 'rb') as f:
+            return SESSION.post(BRIDGE_INGEST_URL, params=meta, data=f, headers={"Content-Type": "text/plain; charset=utf-8"}, timeout=10)
+
+    def _mark_ingested(self, payloads):
+        with self._lock:
+            # The stat taken when the payload was prepared, not the latest one: the file may
+            # have changed again since, and that version has not been ingested yet
+            for p in payloads: self._ingested[p["filename"]] = list(p["stat"])
+            self._dirty = True
 
-    def on_modified(self, event): 
-        if not event.is_directory: self.process(event.src_path)
-    def on_created(self, event):
-        if not event.is_directory: self.process(event.src_path)
+    def process(self, filepath):
+        payload = self.prepare(filepath, read=not STREAM_UPLOAD)
+        if payload: self.ingest([payload])
+
+    def schedule(self, filepath):
+        """Coalesce event bursts: filepath is processed once, DEBOUNCE_SECONDS after its last event."""
+        with self._lock:
+            self._due_at[filepath] = time.monotonic() + DEBOUNCE_SECONDS
+            if self._coalescer is None:
+                self._coalescer = threading.Thread(target=self._coalesce, daemon=True)
+                self._coalescer.start()
+
+    def _coalesce(self):
+        # A single timer thread serves every pending path and exits once nothing is pending
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                for path in [p for p, due in self._due_at.items() if due <= now]:
+                    del self._due_at[path]
+                    self._enqueue(path)
+                if not self._due_at:
+                    self._coalescer = None
+                    return
+                delay = min(self._due_at.values()) - now
+            time.sleep(delay)
+
+    def _enqueue(self, filepath):
+        try:
+            self._events.put_nowait(filepath)
+        except queue.Full:
+            logger.warning(f"⚠️  Event queue full - dropping {os.path.basename(filepath)}")
+
+    def _consume(self):
+        while True:
+            filepath = self._events.get()
+            if filepath is None: return
+            try:
+                self.process(filepath)
+            except Exception as e:
+                logger.error(f"❌ Error processing {os.path.basename(filepath)}: {e}")
+
+    def stop(self):
+        """Let the workers finish queued events, then exit."""
+        for _ in self._workers: self._events.put(None)
+        for worker in self._workers: worker.join()
+
+    def on_event(self, event):
+        # Filter on the raw path before any scheduling work; bulk copies fire many events
+        if event.is_directory: return
+        src = event.src_path
+        if os.path.splitext(src)[1].lower() in ALLOWED_EXTENSIONS: self.schedule(src)
+
+    on_modified = on_event
+    on_created = on_event
 
 def wait_for_bridge():
     """Wait for the bridge to become available."""
+    global STREAM_UPLOAD
     logger.info("⏳ Waiting for Bridge to come online...")
     url = f"http://localhost:{PORT}/health"
     for i in range(30): # Wait up to 30 seconds
         try:
-            requests.get(url, timeout=2)
+            response = SESSION.get(url, timeout=2)
             logger.info("🟢 Bridge is Online!")
+            try:
+                STREAM_UPLOAD = bool(response.json().get("ingest_stream"))
+            except ValueError:
+                pass
             return True
         except:
             time.sleep(1)
     logger.error("❌ Bridge unreachable after 30s. Exiting.")
     return False
 
+def warm_up(connections):
+    """Open `connections` pooled keep-alive sockets with concurrent /health GETs, so the
+    first ingest POSTs from each worker skip the connect."""
+    url = f"http://localhost:{PORT}/health"
+    def ping(_):
+        try: SESSION.get(url, timeout=2)
+        except requests.exceptions.RequestException: pass
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        list(pool.map(ping, range(connections)))
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch the context folder and ingest changes into the Bridge.")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE, help="Max files per ingest request during initial indexing")
+    parser.add_argument("--max-batch-bytes", type=int, default=MAX_BATCH_BYTES, help="Max content bytes per ingest request during initial indexing")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE, help="Max entries kept in each per-file cache")
+    args = parser.parse_args()
+
     if not os.path.exists(WATCH_DIR): os.makedirs(WATCH_DIR)
     
     # Wait for Bridge
     if not wait_for_bridge():
         sys.exit(1)
 
-    handler = Handler()
+    warm_up(INGEST_CONCURRENCY)
+    handler = Handler(cache_size=args.cache_size)
     
     # Initial Indexing
     logger.info("🔍 Starting Initial Index Walk...")
-    for root, dirs, files in os.walk(WATCH_DIR):
-        for file in files:
-            handler.process(os.path.join(root, file))
+    # Overlap reads and ingest round-trips, capped at INGEST_CONCURRENCY each; changed files go up in
+    # batches as they are read, so only the batches in flight are held in memory
+    with ThreadPoolExecutor(max_workers=INGEST_CONCURRENCY) as readers, ThreadPoolExecutor(max_workers=INGEST_CONCURRENCY) as senders:
+        payloads = (p for p in bounded_map(readers, handler.prepare, walk_files(WATCH_DIR), INGEST_CONCURRENCY) if p)
+        for _ in bounded_map(senders, handler.ingest, batched(payloads, args.max_batch_size, args.max_batch_bytes), INGEST_CONCURRENCY): pass
+    handler.save_cache()
     logger.info("✅ Initial Indexing Complete")
 
     obs = Observer()
@@ -117,6 +404,10 @@ if __name__ == "__main__":
     obs.start()
     logger.info(f"🐕 Watchdog Active: {WATCH_DIR}")
     try:
-        while True: time.sleep(1)
+        while True:
+            time.sleep(CACHE_SAVE_INTERVAL)
+            handler.save_cache()
     except KeyboardInterrupt: obs.stop()
     obs.join()
+    handler.stop()
+    handler.save_cache()
@@ -4,12 +4,20 @@ import asyncio
 import uuid
 import json
 import time
+import re
+import hashlib
 import uvicorn
 from fastapi import FastAPI, WebSocket, Request
 from fastapi.responses import JSONResponse, FileResponse, RedirectResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict
+from collections import OrderedDict
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
 
 # Import configuration manager
 from config_manager import get_config
@@ -823,54 +831,141 @@ async def memory_search(request: Request):
         if req_id in active_requests: del active_requests[req_id]
         return JSONResponse(status_code=500, content={"error": str(e)})
 
-@app.post("/v1/memory/ingest")
-async def memory_ingest(request: Request):
-    """Ingest context files from the watchdog service.
-    
-    Accepts files from the context/ folder and forwards them to the Ghost Engine
-    for processing and memory storage.
+# Near-duplicate filter across sources: copied or templated files that differ by a line or two
+# are not re-embedded. MinHash-LSH over word 5-grams when datasketch is installed; without it,
+# only exact copies are caught, via a hash of the whole normalized text. Each source keeps only
+# the fingerprint of its last successful ingest, and at most MAX_DEDUP_SOURCES sources are
+# remembered (oldest dropped first).
+_DEDUP_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_DEDUP_SHINGLE = 5
+MAX_DEDUP_SOURCES = config.get("memory.max_dedup_sources", 10000)
+_dedup_lsh = MinHashLSH(threshold=0.85, num_perm=64) if MinHashLSH is not None else None
+_dedup_exact: Dict[str, str] = {}  # normalized-text hash -> source (fallback without datasketch)
+_dedup_fingerprints: "OrderedDict[str, object]" = OrderedDict()  # source -> its registered fingerprint
+
+def _fingerprint(content: str):
+    """Fingerprint content for the near-duplicate filter, or None if it is too short.
+
+    CPU-bound on large files, so callers run it off the event loop.
     """
-    if not workers["chat"]:
-        await add_log_entry("Memory-API", "error", "Memory ingest requested but Ghost Engine is disconnected")
-        return JSONResponse(status_code=503, content={"error": "Ghost Engine Disconnected"})
-
+    tokens = _DEDUP_TOKEN_RE.findall(content.lower())
+    if len(tokens) < _DEDUP_SHINGLE:
+        return None  # too short to fingerprint meaningfully
+    if _dedup_lsh is None:
+        return hashlib.sha1(" ".join(tokens).encode()).hexdigest()
+    minhash = MinHash(num_perm=64)
+    minhash.update_batch([" ".join(tokens[i:i + _DEDUP_SHINGLE]).encode() for i in range(len(tokens) - _DEDUP_SHINGLE + 1)])
+    return minhash
+
+def _near_duplicate_of(source: str, fingerprint):
+    """Return another source whose registered content nearly matches fingerprint, or None."""
+    if _dedup_lsh is None:
+        owner = _dedup_exact.get(fingerprint)
+        return owner if owner != source else None
+    for match in _dedup_lsh.query(fingerprint):
+        if match != source:
+            return match
+    return None
+
+def _forget_fingerprint(source: str):
+    fingerprint = _dedup_fingerprints.pop(source, None)
+    if fingerprint is None:
+        return
+    if _dedup_lsh is None:
+        if _dedup_exact.get(fingerprint) == source:
+            del _dedup_exact[fingerprint]
+    else:
+        _dedup_lsh.remove(source)
+
+def _register_fingerprint(source: str, fingerprint):
+    """Record fingerprint for source after a successful ingest, replacing its previous one."""
+    _forget_fingerprint(source)
+    _dedup_fingerprints[source] = fingerprint
+    if _dedup_lsh is None:
+        _dedup_exact.setdefault(fingerprint, source)
+    else:
+        _dedup_lsh.insert(source, fingerprint)
+    while len(_dedup_fingerprints) > MAX_DEDUP_SOURCES:
+        _forget_fingerprint(next(iter(_dedup_fingerprints)))
+
+def _iso_now() -> str:
+    return datetime.datetime.now().isoformat()
+
+async def _forward_ingest(item: dict) -> dict:
+    """Forward one ingest item to the Ghost Engine and wait for its acknowledgment."""
+    source = item.get("source", "unknown")
+    fingerprint = await asyncio.to_thread(_fingerprint, item.get("content", ""))
+    duplicate_of = _near_duplicate_of(source, fingerprint) if fingerprint is not None else None
+    if duplicate_of:
+        await add_log_entry("Memory-API", "info", f"[Dedup] Skipping ingest of '{source}': near-duplicate of '{duplicate_of}'")
+        return {"status": "skipped", "source": source, "duplicate_of": duplicate_of}
+
+    req_id = str(uuid.uuid4())
+    active_requests[req_id] = asyncio.Queue()
     try:
-        body = await request.json()
-        source = body.get("source", "unknown")
-        content = body.get("content", "")
-        timestamp = body.get("timestamp", datetime.datetime.now().isoformat())
-        file_type = body.get("file_type", ".txt")
-        
-        req_id = str(uuid.uuid4())
-        active_requests[req_id] = asyncio.Queue()
-
         await add_log_entry("Memory-API", "info", f"Forwarding memory ingest request from '{source}' (ID: {req_id}) to Ghost Engine")
-        
+
         # Send to Ghost Engine for processing
         await workers["chat"].send_json({
             "type": "memory_ingest",
             "id": req_id,
             "source": source,
-            "content": content,
-            "timestamp": timestamp,
-            "file_type": file_type
+            "content": item.get("content", ""),
+            "timestamp": item.get("timestamp") or _iso_now(),
+            "file_type": item.get("file_type", ".txt")
         })
 
         # Wait for acknowledgment (with timeout from configuration)
         timeout = config.get("memory.ingest_timeout", 10.0)
         result = await asyncio.wait_for(active_requests[req_id].get(), timeout=timeout)
-        del active_requests[req_id]
+    finally:
+        active_requests.pop(req_id, None)
+
+    # Only content the Ghost Engine acknowledged may suppress later near-duplicates
+    if fingerprint is not None:
+        _register_fingerprint(source, fingerprint)
+    await add_log_entry("Memory-API", "info", f"Memory ingest completed successfully for '{source}'")
+    return {"status": "success", "source": source, "result": result}
+
+@app.post("/v1/memory/ingest")
+async def memory_ingest(request: Request):
+    """Ingest context files from the watchdog service.
+    
+    Accepts files from the context/ folder and forwards them to the Ghost Engine
+    for processing and memory storage. The body is either a single item or a
+    batch ({"items": [...]} or a bare list), so one request can carry many files.
+    A single item may also stream the file as a text/plain body with its
+    metadata in the query string.
+    """
+    if not workers["chat"]:
+        await add_log_entry("Memory-API", "error", "Memory ingest requested but Ghost Engine is disconnected")
+        return JSONResponse(status_code=503, content={"error": "Ghost Engine Disconnected"})
 
-        await add_log_entry("Memory-API", "info", f"Memory ingest completed successfully for '{source}'")
-        return {"status": "success", "source": source, "result": result}
+    body = {}
+    try:
+        if request.headers.get("content-type", "").startswith("text/plain"):
+            body = dict(request.query_params)
+            body["content"] = (await request.body()).decode("utf-8", errors="ignore")
+            return await _forward_ingest(body)
+
+        body = await request.json()
+        items = body.get("items") if isinstance(body, dict) else body
+        if not isinstance(items, list):
+            return await _forward_ingest(body)
+
+        results = await asyncio.gather(*(_forward_ingest(item) for item in items), return_exceptions=True)
+        for i, r in enumerate(results):
+            if isinstance(r, Exception):
+                error = "Ingest request timed out" if isinstance(r, asyncio.TimeoutError) else str(r)
+                await add_log_entry("Memory-API", "error", f"Memory ingest failed for source '{items[i].get('source', '')}': {error}")
+                results[i] = {"status": "error", "source": items[i].get("source", "unknown"), "error": error}
+        return {"status": "success", "results": results}
     
     except asyncio.TimeoutError:
         await add_log_entry("Memory-API", "error", f"Memory ingest timed out for source '{body.get('source', '')}'")
-        if req_id in active_requests: del active_requests[req_id]
         return JSONResponse(status_code=504, content={"error": "Ingest request timed out"})
     except Exception as e:
         await add_log_entry("Memory-API", "error", f"Memory ingest failed with error: {str(e)}")
-        if req_id in active_requests: del active_requests[req_id]
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 @app.get("/context", response_class=HTMLResponse)
@@ -910,7 +1005,7 @@ async def collect_log(request: Request):
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    return {"status": "nominal", "engine": "connected" if workers["chat"] else "waiting", "timestamp": datetime.datetime.now().isoformat()}
+    return {"status": "nominal", "engine": "connected" if workers["chat"] else "waiting", "timestamp": datetime.datetime.now().isoformat(), "ingest_stream": True}
 
 # --- WEBSOCKETS ---
 @app.websocket("/ws/chat")
@@ -1,6 +1,9 @@
 import sys, time, os, requests, hashlib, logging
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 WATCH_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "context"))
 BRIDGE_INGEST_URL = "http://localhost:8000/v1/memory/ingest"
@@ -21,10 +24,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+HASH_CHUNK = 64 * 1024
+INGEST_CONCURRENCY = 8
+
+# One pooled keep-alive session for every Bridge call, so repeated ingests reuse the TCP connection.
+# Connect failures are retried for every method. Read errors and 5xx statuses are retried for the
+# default idempotent methods only: an ingest POST may already have reached the Ghost Engine.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=INGEST_CONCURRENCY,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
+def file_digest(filepath):
+    """Hash a file in 64 KiB chunks (BLAKE3 if installed, else BLAKE2b) without reading it whole."""
+    hasher = blake3.blake3() if blake3 is not None else hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
 class Handler(FileSystemEventHandler):
     def __init__(self):
         self.hashes = {}
         self.last_mod = {}
+        self._stat_cache = {}  # filepath -> (mtime_ns, size, digest)
 
     def process(self, filepath):
         _, ext = os.path.splitext(filepath)
@@ -36,11 +65,14 @@ class Handler(FileSystemEventHandler):
         self.last_mod[filepath] = now
         time.sleep(0.1)
         
-        hasher = hashlib.md5()
         try:
-            with open(filepath, 'rb') as f: hasher.update(f.read())
-            new_hash = hasher.hexdigest()
-        except: return
+            st = os.stat(filepath)
+            cached = self._stat_cache.get(filepath)
+            # Spurious events for an unchanged file: skip without reading it
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size): return
+            new_hash = file_digest(filepath)
+            self._stat_cache[filepath] = (st.st_mtime_ns, st.st_size, new_hash)
+        except OSError: return
         
         if self.hashes.get(filepath) == new_hash: return
         self.hashes[filepath] = new_hash
@@ -49,7 +81,7 @@ class Handler(FileSystemEventHandler):
         try:
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
             payload = { "filename": os.path.relpath(filepath, WATCH_DIR), "content": content, "filetype": ext }
-            requests.post(BRIDGE_INGEST_URL, json=payload, timeout=5)
+            SESSION.post(BRIDGE_INGEST_URL, json=payload, timeout=5)
             logger.info(f"✅ Ingested")
         except Exception as e: 
             logger.error(f"❌ Error ingesting {os.path.basename(filepath)}: {e}")
@@ -65,7 +97,7 @@ def wait_for_bridge():
     url = "http://localhost:8000/health"
     for i in range(30): # Wait up to 30 seconds
         try:
-            requests.get(url, timeout=2)
+            SESSION.get(url, timeout=2)
             logger.info("🟢 Bridge is Online!")
             return True
         except:
@@ -84,9 +116,10 @@ if __name__ == "__main__":
     
     # Initial Indexing
     logger.info("🔍 Starting Initial Index Walk...")
-    for root, dirs, files in os.walk(WATCH_DIR):
-        for file in files:
-            handler.process(os.path.join(root, file))
+    paths = [os.path.join(root, file) for root, dirs, files in os.walk(WATCH_DIR) for file in files]
+    # Overlap ingest round-trips, capped at INGEST_CONCURRENCY in-flight requests
+    with ThreadPoolExecutor(max_workers=INGEST_CONCURRENCY) as pool:
+        list(pool.map(handler.process, paths))
     logger.info("✅ Initial Indexing Complete")
 
     obs = Observer()